@@ -1,4 +1,7 @@
-import yfinance as yf
+import sys
+import warnings
+from pathlib import Path
+
 import pandas as pd
 import Event
 import queue
@@ -13,8 +16,18 @@ class DataHandler:
         self.data_iterator = self.all_data.itertuples()
 
     def get_data(self, tickers, start_date, end_date):
+        # the shared price cache lives at the repo root, one level up
+        root = str(Path(__file__).resolve().parents[1])
+        if root not in sys.path:
+            sys.path.append(root)
+        try:
+            from price_cache import download
+        except ImportError as e:
+            warnings.warn(f"price cache unavailable ({e}), downloading uncached")
+            from yfinance import download
+
         try:
-            data = yf.download(tickers, start=start_date, end=end_date)
+            data = download(tickers, start=start_date, end=end_date)
             return data
         except Exception as e:
             print(f"Error fetching data: {e}")
@@ -1,7 +1,18 @@
-import yfinance as yf
-import pandas as pd
+import sys
+import warnings
+from pathlib import Path
+
+# the shared price cache lives at the repo root, two levels up
+root = str(Path(__file__).resolve().parents[2])
+if root not in sys.path:
+    sys.path.append(root)
+try:
+    from price_cache import download
+except ImportError as e:
+    warnings.warn(f"price cache unavailable ({e}), downloading uncached")
+    from yfinance import download
 
 tickers = ["AAPL", "MSFT", "GOOG", "AMZN", "META", "TSLA", "NVDA"]
-data = yf.download(tickers, start="2020-01-01", end="2025-01-01")["Close"]
+data = download(tickers, start="2020-01-01", end="2025-01-01")["Close"]
 
-data.to_csv("tech_prices.csv")
+data.to_csv(Path(__file__).parent / "tech_prices.csv")
@@ -6,6 +6,14 @@ from .data_handler import (
     plot_heatmaps,
     plot_pca_scree,
 )
+from .multi_asset import (
+    covariance_factor,
+    correlated_gbm_batches,
+    correlated_terminal_batches,
+    basket_option_price,
+    spread_option_price,
+    portfolio_var,
+)
 
 __all__ = [
     "load_data",
@@ -14,4 +22,10 @@ __all__ = [
     "eigen_pca",
     "plot_heatmaps",
     "plot_pca_scree",
+    "covariance_factor",
+    "correlated_gbm_batches",
+    "correlated_terminal_batches",
+    "basket_option_price",
+    "spread_option_price",
+    "portfolio_var",
 ]
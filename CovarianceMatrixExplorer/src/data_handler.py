@@ -1,7 +1,8 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+# matplotlib/seaborn are imported inside the plotting functions: they take
+# over a second to import and most callers only need the numbers.
 
 
 def load_data(file_path):
@@ -27,6 +28,9 @@ def covariance_correlation(data):
 
 
 def plot_heatmaps(cov, corr, tickers):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     fig, axes = plt.subplots(1, 1, figsize=(14, 6))
 
     sns.heatmap(
@@ -50,6 +54,8 @@ def plot_heatmaps(cov, corr, tickers):
 
 
 def plot_pca_scree(eigvals):
+    import matplotlib.pyplot as plt
+
     total_var = np.sum(eigvals)
     explained_var_ratio = eigvals / total_var
     cum_var = np.cumsum(explained_var_ratio)
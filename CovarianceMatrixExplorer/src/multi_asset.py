@@ -0,0 +1,203 @@
+import warnings
+
+import numpy as np
+
+# Correlated multi-asset GBM driven by a covariance matrix (e.g. the one from
+# covariance_correlation). The covariance is factorised once and paths are
+# generated in batches, so memory is batch_paths * n_steps * n_assets no matter
+# how many paths are asked for.
+#
+# Units: cov and drift are per unit of T. Daily log-return covariance with T in
+# days, or annualised covariance (daily * 252) with T in years.
+
+
+def covariance_factor(cov, eig_floor=1e-12):
+    """Returns A with A @ A.T == cov (or its nearest PSD clip)."""
+    cov = np.asarray(cov, dtype=float)
+    cov = 0.5 * (cov + cov.T)
+    try:
+        return np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        # Not positive definite (estimated from too few observations, or a
+        # hand-edited correlation matrix): clip the eigenvalues instead.
+        eigvals, eigvecs = np.linalg.eigh(cov)
+        floor = eig_floor * max(eigvals.max(), eig_floor)
+        warnings.warn(
+            f"covariance not positive definite, clipping {np.sum(eigvals < floor)}"
+            " eigenvalue(s)"
+        )
+        return eigvecs * np.sqrt(np.clip(eigvals, floor, None))
+
+
+def _setup(s_0, drift, cov, factor):
+    s_0 = np.asarray(s_0, dtype=float)
+    if factor is None:
+        factor = covariance_factor(cov)
+    # Ito correction per asset, so E[S_T] = s_0 * exp(drift * T). It uses the
+    # variances actually simulated, diag(A @ A.T), which differ from cov's
+    # when covariance_factor had to clip eigenvalues
+    log_drift = np.asarray(drift, dtype=float) - 0.5 * np.sum(factor**2, axis=1)
+    return s_0, log_drift, factor
+
+
+def correlated_gbm_batches(
+    s_0,
+    drift,
+    cov,
+    T,
+    n_steps,
+    n_paths,
+    batch_paths=1000,
+    factor=None,
+    rng=None,
+):
+    # yields price paths of shape (batch, n_steps, n_assets) on t = dt..T
+    rng = np.random.default_rng() if rng is None else rng
+    s_0, log_drift, factor = _setup(s_0, drift, cov, factor)
+    dt = T / n_steps
+    for start in range(0, n_paths, batch_paths):
+        n = min(batch_paths, n_paths - start)
+        Z = rng.standard_normal((n, n_steps, len(s_0)))
+        X = Z @ (factor.T * np.sqrt(dt))  # correlated log-increments
+        X += log_drift * dt
+        np.cumsum(X, axis=1, out=X)
+        np.exp(X, out=X)
+        X *= s_0
+        yield X
+
+
+def correlated_terminal_batches(
+    s_0, drift, cov, T, n_paths, batch_paths=100_000, factor=None, rng=None
+):
+    # European payoffs only need S_T, which GBM gives exactly in one step
+    # yields (batch, n_assets)
+    rng = np.random.default_rng() if rng is None else rng
+    s_0, log_drift, factor = _setup(s_0, drift, cov, factor)
+    for start in range(0, n_paths, batch_paths):
+        n = min(batch_paths, n_paths - start)
+        X = rng.standard_normal((n, len(s_0))) @ (factor.T * np.sqrt(T))
+        X += log_drift * T
+        np.exp(X, out=X)
+        X *= s_0
+        yield X
+
+
+def _price_from_batches(batches, payoff, r, T):
+    # streaming mean / standard error of the discounted payoff; per-batch
+    # moments are merged pairwise (Chan et al.) so a large mean payoff
+    # doesn't cancel the variance away
+    count, mean, m2 = 0, 0.0, 0.0
+    for S_T in batches:
+        p = payoff(S_T)
+        n, batch_mean = len(p), p.mean()
+        delta = batch_mean - mean
+        mean += delta * n / (count + n)
+        m2 += ((p - batch_mean) ** 2).sum() + delta**2 * count * n / (count + n)
+        count += n
+    var = m2 / (count - 1)
+    disc = np.exp(-r * T)
+    return disc * mean, disc * np.sqrt(var / count)
+
+
+def basket_option_price(
+    s_0,
+    weights,
+    K,
+    r,
+    cov,
+    T,
+    n_paths=1_000_000,
+    option_type="call",
+    batch_paths=100_000,
+    rng=None,
+):
+    # payoff on sum_i w_i S_i(T); returns (price, std_error)
+    weights = np.asarray(weights, dtype=float)
+    sign = {"call": 1.0, "put": -1.0}[option_type]
+    batches = correlated_terminal_batches(s_0, r, cov, T, n_paths, batch_paths, rng=rng)
+    return _price_from_batches(
+        batches, lambda S: np.maximum(sign * (S @ weights - K), 0.0), r, T
+    )
+
+
+def spread_option_price(
+    s_0,
+    K,
+    r,
+    cov,
+    T,
+    assets=(0, 1),
+    n_paths=1_000_000,
+    batch_paths=100_000,
+    rng=None,
+):
+    # call on S_i(T) - S_j(T) - K, for assets (i, j) of a bigger universe
+    i, j = assets
+    batches = correlated_terminal_batches(s_0, r, cov, T, n_paths, batch_paths, rng=rng)
+    return _price_from_batches(
+        batches, lambda S: np.maximum(S[:, i] - S[:, j] - K, 0.0), r, T
+    )
+
+
+def portfolio_var(
+    prices,
+    weights,
+    horizon_days=10,
+    alpha=0.99,
+    portfolio_value=1_000_000,
+    n_paths=100_000,
+    batch_paths=50_000,
+    rng=None,
+):
+    # Monte Carlo VaR / expected shortfall of a buy-and-hold portfolio, from
+    # the daily log-return mean and covariance of a price DataFrame
+    log_ret = np.log(prices / prices.shift(1)).dropna()
+    mu = log_ret.mean().to_numpy()
+    cov = np.cov(log_ret, rowvar=False)
+    weights = np.asarray(weights, dtype=float)
+    weights = weights / weights.sum()
+
+    # simulate price relatives S_T / S_0, so drift is the arithmetic drift
+    drift = mu + 0.5 * np.diag(cov)
+    batches = correlated_terminal_batches(
+        np.ones(len(weights)), drift, cov, horizon_days, n_paths, batch_paths, rng=rng
+    )
+    pnl = np.concatenate([portfolio_value * (S @ weights - 1.0) for S in batches])
+    losses = -pnl
+    var = np.quantile(losses, alpha)
+    es = losses[losses >= var].mean()
+    return var, es
+
+
+def main():
+    import pandas as pd
+    from pathlib import Path
+
+    data_file = Path(__file__).resolve().parents[1] / "data" / "tech_prices.csv"
+    prices = pd.read_csv(data_file, index_col=0, parse_dates=True)
+    log_ret = np.log(prices / prices.shift(1)).dropna()
+    annual_cov = np.cov(log_ret, rowvar=False) * 252
+    s_0 = prices.iloc[-1].to_numpy()
+    n = len(s_0)
+    r, T = 0.04, 1.0
+
+    weights = np.full(n, 1 / n)
+    K = s_0 @ weights
+    print(
+        "Equal-weight basket ATM call = %.4f (se %.4f)"
+        % basket_option_price(s_0, weights, K, r, annual_cov, T)
+    )
+    print(
+        "%s - %s spread call (K=0) = %.4f (se %.4f)"
+        % (
+            prices.columns[0],
+            prices.columns[1],
+            *spread_option_price(s_0, 0.0, r, annual_cov, T),
+        )
+    )
+    var, es = portfolio_var(prices, weights)
+    print(f"10-day 99% VaR on 1m: {var:,.0f}, expected shortfall: {es:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import time
+from statistics import NormalDist
+from typing import NamedTuple
+
+import numpy as np
+from numpy import exp, sqrt
+
+
+class AmericanEstimate(NamedTuple):
+    """Longstaff-Schwartz price with its standard error, CI and run time."""
+
+    price: float
+    std_error: float
+    ci_low: float
+    ci_high: float
+    num_simulations: int
+    num_exercise_dates: int
+    elapsed_seconds: float
+
+
+def _bridge_step_back(W, t_next, t_prev, rng):
+    """Draws W(t_prev) given W(t_next) and W(0) = 0 (Brownian bridge)."""
+    if t_prev == 0:
+        return np.zeros_like(W)
+    mean = W * (t_prev / t_next)
+    std = sqrt(t_prev * (t_next - t_prev) / t_next)
+    return mean + std * rng.standard_normal(len(W))
+
+
+def _basis(moneyness, degree):
+    """Polynomial regressors [1, m, m^2, ...] in moneyness S/K."""
+    return np.vander(moneyness, degree + 1, increasing=True)
+
+
+def _continuation_coefficients(moneyness, values, degree, chunk_size):
+    """Least-squares fit of values on the basis, accumulating X'X and X'y.
+
+    Only a (chunk_size, degree + 1) design matrix exists at a time, so the
+    regression over ~1e6 in-the-money paths stays small.
+    """
+    XtX = np.zeros((degree + 1, degree + 1))
+    Xty = np.zeros(degree + 1)
+    for start in range(0, len(values), chunk_size):
+        X = _basis(moneyness[start : start + chunk_size], degree)
+        XtX += X.T @ X
+        Xty += X.T @ values[start : start + chunk_size]
+    coef, *_ = np.linalg.lstsq(XtX, Xty, rcond=None)
+    return coef
+
+
+def longstaff_schwartz(
+    model,
+    option_type="put",
+    num_simulations=100_000,
+    num_exercise_dates=50,
+    basis_degree=3,
+    chunk_size=250_000,
+    confidence=0.95,
+    seed=None,
+):
+    """Prices an American option by Longstaff-Schwartz regression.
+
+    Paths are never stored: W(T) is drawn for every path and the earlier
+    exercise dates are filled in backwards with Brownian-bridge draws, so
+    memory is a handful of ``num_simulations``-long arrays regardless of
+    ``num_exercise_dates``. At each date the discounted realised cash flows of
+    in-the-money paths are regressed on a polynomial in S/K to decide
+    exercise. The standard error is that of the per-path discounted cash
+    flows; the in-sample LSM price is slightly biased high.
+    """
+    if option_type not in ("call", "put"):
+        raise ValueError("option_type must be 'call' or 'put'")
+
+    start_time = time.perf_counter()
+    S0 = model.spot_price
+    K = model.strike_price
+    T = model.time_to_maturity
+    r = model.risk_free_rate
+    sigma = model.volatility
+    rng = np.random.default_rng(seed)
+
+    def payoff(S):
+        return np.maximum(S - K, 0) if option_type == "call" else np.maximum(K - S, 0)
+
+    times = np.linspace(0, T, num_exercise_dates + 1)
+    dt = T / num_exercise_dates
+    drift = r - 0.5 * sigma**2
+
+    # Cash flow of each path discounted back to the current date
+    W = sqrt(T) * rng.standard_normal(num_simulations)
+    values = payoff(S0 * exp(drift * T + sigma * W))
+
+    for k in range(num_exercise_dates - 1, 0, -1):
+        W = _bridge_step_back(W, times[k + 1], times[k], rng)
+        values *= exp(-r * dt)
+        S = S0 * exp(drift * times[k] + sigma * W)
+        exercise = payoff(S)
+        itm = np.flatnonzero(exercise > 0)
+        if len(itm) <= basis_degree + 1:
+            continue
+        moneyness = S[itm] / K
+        coef = _continuation_coefficients(
+            moneyness, values[itm], basis_degree, chunk_size
+        )
+        continuation = np.polyval(coef[::-1], moneyness)
+        exercise_now = itm[exercise[itm] > continuation]
+        values[exercise_now] = exercise[exercise_now]
+
+    values *= exp(-r * dt)
+    price = values.mean()
+    std_error = values.std(ddof=1) / sqrt(num_simulations)
+    if payoff(S0) > price:
+        # exercising immediately beats holding on every path
+        price, std_error = float(payoff(S0)), 0.0
+    half_width = NormalDist().inv_cdf(0.5 + confidence / 2) * std_error
+    return AmericanEstimate(
+        price=float(price),
+        std_error=float(std_error),
+        ci_low=float(price - half_width),
+        ci_high=float(price + half_width),
+        num_simulations=num_simulations,
+        num_exercise_dates=num_exercise_dates,
+        elapsed_seconds=time.perf_counter() - start_time,
+    )
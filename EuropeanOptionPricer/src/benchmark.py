@@ -0,0 +1,211 @@
+import time
+
+import numpy as np
+
+from cli import parse_benchmark_args
+from implied_vol import implied_volatility
+from model import EuropeanOptionPricerModel, price_option_chain
+
+
+def synthetic_option_chain(num_contracts, seed=0):
+    """Random strike/expiry/vol grid around a single spot, including expiries."""
+    rng = np.random.default_rng(seed)
+    spot = np.full(num_contracts, 100.0)
+    strike = rng.uniform(50, 150, num_contracts)
+    maturity = rng.choice([0.0, 1 / 52, 1 / 12, 0.25, 0.5, 1.0, 2.0], num_contracts)
+    rate = np.full(num_contracts, 0.05)
+    vol = rng.uniform(0.05, 0.8, num_contracts)
+    return spot, strike, maturity, rate, vol
+
+
+def time_scalar_path(spot, strike, maturity, rate, vol):
+    """Prices each contract with its own model object, as the CLI does."""
+    start = time.perf_counter()
+    calls = np.empty(len(spot))
+    puts = np.empty(len(spot))
+    for i in range(len(spot)):
+        model = EuropeanOptionPricerModel(
+            spot_price=float(spot[i]),
+            strike_price=float(strike[i]),
+            time_to_maturity=float(maturity[i]),
+            risk_free_rate=float(rate[i]),
+            volatility=float(vol[i]),
+        )
+        calls[i] = model.bsm_call_price()
+        puts[i] = model.bsm_put_price()
+    return time.perf_counter() - start, calls, puts
+
+
+def time_vectorized_path(spot, strike, maturity, rate, vol):
+    """Prices the whole chain in one vectorized pass."""
+    start = time.perf_counter()
+    calls, puts = price_option_chain(spot, strike, maturity, rate, vol)
+    return time.perf_counter() - start, calls, puts
+
+
+def qmc_convergence(max_simulations, seed=0, num_replicates=16):
+    """Error and wall-clock of pseudo-random vs quasi-MC for growing path counts.
+
+    Uses an at-the-money-forward call so the BSM price is the reference value.
+    """
+    model = EuropeanOptionPricerModel(
+        spot_price=100.0,
+        strike_price=105.0,
+        time_to_maturity=1.0,
+        risk_free_rate=0.05,
+        volatility=0.2,
+    )
+    exact = model.bsm_call_price()
+
+    # warm each sampler up once so its lazy imports (scipy.stats.qmc) don't
+    # land in the first timing
+    model.monte_carlo_estimate("call", 1024, seed=seed)
+    for sampler in ("sobol", "halton"):
+        model.quasi_monte_carlo_estimate(
+            "call", 1024, sampler=sampler, num_replicates=2, seed=seed
+        )
+
+    rows = []
+    path_counts = 2 ** np.arange(10, int(np.log2(max_simulations)) + 1)
+    for n in path_counts:
+        row = {"num_simulations": int(n)}
+        start = time.perf_counter()
+        estimate = model.monte_carlo_estimate("call", int(n), seed=seed)
+        row["pseudo"] = (estimate, time.perf_counter() - start)
+        for sampler in ("sobol", "halton"):
+            start = time.perf_counter()
+            estimate = model.quasi_monte_carlo_estimate(
+                "call",
+                int(n),
+                sampler=sampler,
+                num_replicates=num_replicates,
+                seed=seed,
+            )
+            row[sampler] = (estimate, time.perf_counter() - start)
+        rows.append(row)
+    return exact, rows
+
+
+def print_qmc_convergence(exact, rows):
+    print("\n--- Quasi-Monte Carlo Convergence (call, BSM reference) ---")
+    print(f"BSM price: {exact:.6f}")
+    header = f"{'paths':>10}"
+    for sampler in ("pseudo", "sobol", "halton"):
+        header += f" | {sampler + ' |err|':>13} {'std err':>9} {'time':>8}"
+    print(header)
+    for row in rows:
+        line = f"{row['num_simulations']:>10,}"
+        for sampler in ("pseudo", "sobol", "halton"):
+            estimate, elapsed = row[sampler]
+            error = abs(estimate.price - exact)
+            line += f" | {error:>13.2e} {estimate.std_error:>9.2e} {elapsed:>7.3f}s"
+        print(line)
+
+
+def implied_vol_quotes(num_quotes, seed=0, arbitrage_fraction=0.01):
+    """Synthetic call/put quotes priced from known vols, some made arbitrageable."""
+    rng = np.random.default_rng(seed)
+    spot, strike, maturity, rate, vol = synthetic_option_chain(num_quotes, seed)
+    maturity = np.where(maturity == 0, 1 / 12, maturity)
+    option_type = np.where(rng.random(num_quotes) < 0.5, "call", "put")
+    calls, puts = price_option_chain(spot, strike, maturity, rate, vol)
+    quotes = np.where(option_type == "call", calls, puts)
+
+    # Push a few quotes above the spot/strike upper bounds
+    broken = rng.random(num_quotes) < arbitrage_fraction
+    quotes = np.where(broken, spot + strike, quotes)
+    return quotes, spot, strike, maturity, rate, option_type, vol
+
+
+def time_scalar_implied_vol(quotes, spot, strike, maturity, rate, option_type):
+    """Baseline: one Brent root-find per quote over the scalar model."""
+    from scipy.optimize import brentq
+
+    def objective(sigma, i):
+        model = EuropeanOptionPricerModel(
+            spot[i], strike[i], maturity[i], rate[i], sigma
+        )
+        if option_type[i] == "call":
+            return model.bsm_call_price() - quotes[i]
+        return model.bsm_put_price() - quotes[i]
+
+    start = time.perf_counter()
+    for i in range(len(quotes)):
+        try:
+            brentq(objective, 1e-6, 10.0, args=(i,), xtol=1e-8)
+        except ValueError:
+            pass  # no sign change: quote outside the no-arbitrage bounds
+    return time.perf_counter() - start
+
+
+def benchmark_implied_vol(quote_counts, num_scalar_quotes, seed=0):
+    print("\n--- Implied Volatility Benchmark ---")
+    quotes, spot, strike, maturity, rate, option_type, _ = implied_vol_quotes(
+        num_scalar_quotes, seed
+    )
+    scalar_time = time_scalar_implied_vol(
+        quotes, spot, strike, maturity, rate, option_type
+    )
+    print(
+        f"Scalar brentq: {num_scalar_quotes:>10,} quotes in {scalar_time:.3f}s "
+        f"({num_scalar_quotes / scalar_time:,.0f} quotes/s)"
+    )
+
+    for n in quote_counts:
+        quotes, spot, strike, maturity, rate, option_type, vol = implied_vol_quotes(
+            n, seed
+        )
+        start = time.perf_counter()
+        result = implied_volatility(quotes, spot, strike, maturity, rate, option_type)
+        elapsed = time.perf_counter() - start
+
+        calls, puts = price_option_chain(
+            spot, strike, maturity, rate, result.volatility
+        )
+        repriced = np.where(option_type == "call", calls, puts)
+        solved = result.converged
+        print(
+            f"Vectorized:    {n:>10,} quotes in {elapsed:.3f}s "
+            f"({n / elapsed:,.0f} quotes/s), "
+            f"converged {solved.mean():.2%}, "
+            f"rejected {(~result.within_bounds).mean():.2%}, "
+            f"max repricing error {np.max(np.abs(repriced - quotes)[solved]):.2e}"
+        )
+
+
+def benchmark_chain_pricing(args):
+    chain = synthetic_option_chain(args.num_contracts, args.seed)
+    scalar_chain = tuple(param[: args.num_scalar_contracts] for param in chain)
+
+    scalar_time, scalar_calls, scalar_puts = time_scalar_path(*scalar_chain)
+    vector_time, calls, puts = time_vectorized_path(*chain)
+
+    n_scalar = len(scalar_chain[0])
+    max_diff = max(
+        np.max(np.abs(scalar_calls - calls[:n_scalar])),
+        np.max(np.abs(scalar_puts - puts[:n_scalar])),
+    )
+    scalar_rate = n_scalar / scalar_time
+    vector_rate = args.num_contracts / vector_time
+
+    print("\n--- Option Chain Pricing Benchmark ---")
+    print(f"Scalar path:     {n_scalar:>10,} contracts in {scalar_time:.3f}s")
+    print(f"Vectorized path: {args.num_contracts:>10,} contracts in {vector_time:.3f}s")
+    print(f"Scalar throughput:     {scalar_rate:>14,.0f} contracts/s")
+    print(f"Vectorized throughput: {vector_rate:>14,.0f} contracts/s")
+    print(f"Speed-up: {vector_rate / scalar_rate:,.1f}x")
+    print(f"Max abs difference vs scalar path: {max_diff:.2e}")
+
+
+def main():
+    args = parse_benchmark_args()
+    if args.benchmark in ("chain", "all"):
+        benchmark_chain_pricing(args)
+    if args.benchmark in ("qmc", "all"):
+        print_qmc_convergence(*qmc_convergence(args.qmc_max_simulations, args.seed))
+    if args.benchmark in ("iv", "all"):
+        benchmark_implied_vol(args.iv_quote_counts, args.num_scalar_quotes, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -42,5 +42,223 @@ def parse_args():
         required=True,
         choices=["call", "put", "all"],
     )
+    parser.add_argument(
+        "--variance-reduction",
+        help="Monte Carlo variance reduction technique",
+        type=str,
+        default="none",
+        choices=["none", "antithetic", "control-variate", "moment-matching"],
+    )
+    budget = parser.add_mutually_exclusive_group()
+    budget.add_argument(
+        "--target-std-error",
+        help="stop adding paths once the MC standard error reaches this value "
+        "(--num-simulations becomes the upper limit)",
+        type=float,
+        default=None,
+    )
+    budget.add_argument(
+        "--num-workers",
+        help="run the fixed path budget in chunks across this many processes",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--chunk-size",
+        help="paths simulated at a time by each worker process",
+        type=int,
+        default=1_000_000,
+    )
+    parser.add_argument(
+        "--batch-size",
+        help="paths simulated per step when targeting a standard error",
+        type=int,
+        default=100_000,
+    )
+    parser.add_argument(
+        "--confidence",
+        help="confidence level of the reported MC interval",
+        type=float,
+        default=0.95,
+    )
+    parser.add_argument(
+        "--seed", help="seed for the Monte Carlo random numbers", type=int, default=None
+    )
+    parser.add_argument(
+        "--sampler",
+        help="pseudo-random or scrambled low-discrepancy (quasi-MC) sampling",
+        type=str,
+        default="pseudo",
+        choices=["pseudo", "sobol", "halton"],
+    )
+    parser.add_argument(
+        "--qmc-replicates",
+        help="independently scrambled replicates used for the quasi-MC error bar",
+        type=int,
+        default=16,
+    )
+
+    parser.add_argument(
+        "--exercise",
+        help="European exercise, or American via Longstaff-Schwartz regression",
+        type=str,
+        default="european",
+        choices=["european", "american"],
+    )
+    parser.add_argument(
+        "--exercise-dates",
+        help="number of exercise dates for --exercise american",
+        type=int,
+        default=50,
+    )
+
+    parser.add_argument(
+        "--put-via-parity",
+        help="derive the Monte Carlo put from the simulated call by put-call parity",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--greeks",
+        help="also report analytic and single-simulation Monte Carlo Greeks",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--greeks-estimator",
+        help="Monte Carlo Greek estimator",
+        type=str,
+        default="pathwise",
+        choices=["pathwise", "likelihood-ratio"],
+    )
+
+    args = parser.parse_args()
+    if args.sampler != "pseudo" and (
+        args.variance_reduction != "none"
+        or args.target_std_error is not None
+        or args.num_workers is not None
+    ):
+        parser.error(
+            "--sampler sobol/halton cannot be combined with --variance-reduction, "
+            "--target-std-error or --num-workers"
+        )
+    if args.exercise == "american" and (
+        args.sampler != "pseudo"
+        or args.variance_reduction != "none"
+        or args.target_std_error is not None
+        or args.num_workers is not None
+        or args.put_via_parity
+        or args.greeks
+    ):
+        parser.error(
+            "--exercise american only supports plain pseudo-random sampling "
+            "(no --sampler, --variance-reduction, --target-std-error, "
+            "--num-workers, --put-via-parity or --greeks)"
+        )
+    return args
+
+
+def parse_benchmark_args():
+    """Parse command line arguments for the pricing throughput benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark option chain pricing.")
+    parser.add_argument(
+        "--num-contracts",
+        help="number of contracts in the synthetic option chain",
+        type=int,
+        default=500_000,
+    )
+    parser.add_argument(
+        "--num-scalar-contracts",
+        help="number of contracts priced one object at a time for the baseline",
+        type=int,
+        default=5_000,
+    )
+    parser.add_argument(
+        "--seed", help="seed for the synthetic option chain", type=int, default=0
+    )
+    parser.add_argument(
+        "--benchmark",
+        help="which benchmark to run",
+        type=str,
+        default="all",
+        choices=["chain", "qmc", "iv", "all"],
+    )
+    parser.add_argument(
+        "--qmc-max-simulations",
+        help="largest path count in the quasi-MC convergence comparison",
+        type=int,
+        default=2**20,
+    )
+    parser.add_argument(
+        "--iv-quote-counts",
+        help="quote counts for the implied volatility benchmark",
+        type=int,
+        nargs="+",
+        default=[100_000, 1_000_000],
+    )
+    parser.add_argument(
+        "--num-scalar-quotes",
+        help="quotes solved one root-find at a time for the implied volatility baseline",
+        type=int,
+        default=1_000,
+    )
+
+    return parser.parse_args()
+
+
+def _add_endpoint_args(parser):
+    parser.add_argument(
+        "--socket",
+        help="Unix socket path (takes precedence over --host/--port)",
+        type=str,
+        default=None,
+    )
+    parser.add_argument("--host", help="TCP host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", help="TCP port", type=int, default=8765)
+
+
+def parse_server_args():
+    """Parse command line arguments for the pricing server."""
+    parser = argparse.ArgumentParser(description="Run the batched pricing server.")
+    _add_endpoint_args(parser)
+    parser.add_argument(
+        "--max-batch-size",
+        help="largest number of requests priced in one vectorized call",
+        type=int,
+        default=4096,
+    )
+    parser.add_argument(
+        "--batch-window-ms",
+        help="how long the first request in a batch waits for others to join",
+        type=float,
+        default=1.0,
+    )
+    parser.add_argument(
+        "--report-interval",
+        help="seconds between metrics reports (0 disables them)",
+        type=float,
+        default=10.0,
+    )
+
+    return parser.parse_args()
+
+
+def parse_loadgen_args():
+    """Parse command line arguments for the pricing server load generator."""
+    parser = argparse.ArgumentParser(description="Load test the pricing server.")
+    _add_endpoint_args(parser)
+    parser.add_argument(
+        "--connections",
+        help="number of concurrent client connections",
+        type=int,
+        default=64,
+    )
+    parser.add_argument(
+        "--requests-per-connection",
+        help="requests each connection sends, one at a time",
+        type=int,
+        default=1_000,
+    )
+    parser.add_argument(
+        "--seed", help="seed for the random request parameters", type=int, default=0
+    )
 
     return parser.parse_args()
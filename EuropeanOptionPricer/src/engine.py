@@ -0,0 +1,68 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from model import VARIANCE_REDUCTION_METHODS, _PayoffMoments
+
+
+def _split_paths(num_simulations, chunk_size, num_workers):
+    """Deals fixed-size chunks round-robin so worker ``w`` gets chunks w, w+W, ..."""
+    num_chunks = -(-num_simulations // chunk_size)
+    chunks = [chunk_size] * num_chunks
+    chunks[-1] = num_simulations - chunk_size * (num_chunks - 1)
+    return [chunks[w::num_workers] for w in range(num_workers)]
+
+
+def _simulate_chunks(model, option_type, variance_reduction, chunk_sizes, seed_seq):
+    """Worker: streams its chunks through one generator, keeping only moments."""
+    rng = np.random.default_rng(seed_seq)
+    moments = _PayoffMoments()
+    for n in chunk_sizes:
+        moments.update(
+            *model._discounted_samples(option_type, n, variance_reduction, rng)
+        )
+    return moments
+
+
+def parallel_monte_carlo(
+    model,
+    option_type,
+    num_simulations,
+    variance_reduction="none",
+    chunk_size=1_000_000,
+    num_workers=None,
+    confidence=0.95,
+    seed=None,
+):
+    """Prices a European option with chunked Monte Carlo across processes.
+
+    Each worker draws from its own stream spawned from ``SeedSequence(seed)``
+    and simulates at most ``chunk_size`` paths at a time, so memory stays flat
+    in ``num_simulations``. Worker moments are merged in worker order, which
+    makes the result bit-identical for a given seed and worker count.
+    """
+    if variance_reduction not in VARIANCE_REDUCTION_METHODS:
+        raise ValueError(f"Unknown variance reduction: {variance_reduction}")
+    if num_simulations < 1 or chunk_size < 1:
+        raise ValueError("num_simulations and chunk_size must be positive")
+
+    num_workers = num_workers or os.cpu_count() or 1
+    num_workers = max(1, min(num_workers, -(-num_simulations // chunk_size)))
+    worker_chunks = _split_paths(num_simulations, chunk_size, num_workers)
+    seed_seqs = np.random.SeedSequence(seed).spawn(num_workers)
+
+    jobs = [
+        (model, option_type, variance_reduction, chunks, seed_seq)
+        for chunks, seed_seq in zip(worker_chunks, seed_seqs)
+    ]
+    if num_workers == 1:
+        results = [_simulate_chunks(*jobs[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=num_workers) as pool:
+            results = list(pool.map(_simulate_chunks, *zip(*jobs)))
+
+    moments = _PayoffMoments()
+    for worker_moments in results:
+        moments.merge(worker_moments)
+    return model._estimate(moments, variance_reduction, num_simulations, confidence)
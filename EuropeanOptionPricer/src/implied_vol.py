@@ -0,0 +1,135 @@
+from typing import NamedTuple
+
+import numpy as np
+from numpy import exp, sqrt
+
+from model import EuropeanOptionPricerModel, _normal_pdf
+
+
+class ImpliedVolatility(NamedTuple):
+    """Element-wise implied volatilities with per-quote diagnostics.
+
+    ``volatility`` is NaN wherever no solution was found. ``within_bounds``
+    marks quotes inside the no-arbitrage bounds; ``converged`` marks quotes
+    whose price was matched to the requested tolerance.
+    """
+
+    volatility: np.ndarray
+    converged: np.ndarray
+    within_bounds: np.ndarray
+
+
+def _call_price_and_vega(S, K, T, r, sigma):
+    """BSM call price and vega, sharing d1/d2 from the pricing model."""
+    from scipy.special import ndtr
+
+    model = EuropeanOptionPricerModel(S, K, T, r, sigma)
+    d1, d2 = model._calculate_d1_d2()
+    price = S * ndtr(d1) - K * exp(-r * T) * ndtr(d2)
+    vega = S * _normal_pdf(d1) * sqrt(T)
+    return price, vega
+
+
+def _initial_guess(call_price, S, K, T, r):
+    """Corrado-Miller rational approximation, falling back to Brenner-Subrahmanyam."""
+    X = K * exp(-r * T)
+    half_moneyness = (S - X) / 2
+    excess = call_price - half_moneyness
+    radicand = excess**2 - (S - X) ** 2 / np.pi
+    corrado_miller = (
+        sqrt(2 * np.pi) / (S + X) * (excess + sqrt(np.maximum(radicand, 0)))
+    ) / sqrt(T)
+    brenner = sqrt(2 * np.pi / T) * call_price / S
+    return np.where(radicand >= 0, corrado_miller, brenner)
+
+
+def implied_volatility(
+    price,
+    spot_price,
+    strike_price,
+    time_to_maturity,
+    risk_free_rate,
+    option_type="call",
+    tol=1e-8,
+    max_iter=100,
+    vol_bounds=(1e-6, 10.0),
+):
+    """Solves BSM implied volatility for an array of quotes at once.
+
+    All inputs broadcast against each other; ``option_type`` may be a single
+    ``"call"``/``"put"`` or an array of them, and ``tol`` is in volatility
+    units. Puts are mapped to calls by
+    put-call parity, then every quote starts from a rational initial guess and
+    takes vectorized Newton steps on the log-price. A per-quote bracket is tightened on every
+    iteration and a bisection step replaces any Newton step that would leave
+    it, so flat-vega quotes still converge. Quotes outside the no-arbitrage
+    bounds are reported with NaN volatility instead of raising.
+    """
+    price, S, K, T, r = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=float)
+            for value in (
+                price,
+                spot_price,
+                strike_price,
+                time_to_maturity,
+                risk_free_rate,
+            )
+        )
+    )
+    option_type = np.asarray(option_type)
+    unknown = ~np.isin(option_type, ("call", "put"))
+    if unknown.any():
+        bad = str(option_type[unknown].flat[0])
+        raise ValueError(f"option_type must be 'call' or 'put', got {bad!r}")
+    is_call = np.broadcast_to(option_type == "call", price.shape)
+
+    discounted_strike = K * exp(-r * T)
+    call_price = np.where(is_call, price, price + S - discounted_strike)
+
+    # A finite positive volatility exists only strictly inside these bounds
+    lower_bound = np.maximum(S - discounted_strike, 0)
+    within_bounds = (T > 0) & (call_price > lower_bound) & (call_price < S)
+
+    volatility = np.full(price.shape, np.nan)
+    converged = np.zeros(price.shape, dtype=bool)
+
+    # Only the quotes still being solved are carried through the iterations
+    active = np.flatnonzero(within_bounds)
+    target = call_price.ravel()[active]
+    S_a, K_a, T_a, r_a = (x.ravel()[active] for x in (S, K, T, r))
+    lo = np.full(active.shape, vol_bounds[0])
+    hi = np.full(active.shape, vol_bounds[1])
+    sigma = np.clip(_initial_guess(target, S_a, K_a, T_a, r_a), lo, hi)
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        model_price, vega = _call_price_and_vega(S_a, K_a, T_a, r_a, sigma)
+        diff = model_price - target
+
+        # Stop once the first-order volatility error is within tolerance
+        done = (np.abs(diff) <= tol * vega) | (hi - lo <= tol)
+        volatility.flat[active[done]] = sigma[done]
+        converged.flat[active[done]] = True
+
+        keep = ~done
+        active, target, diff, vega, sigma, lo, hi = (
+            x[keep] for x in (active, target, diff, vega, sigma, lo, hi)
+        )
+        S_a, K_a, T_a, r_a = (x[keep] for x in (S_a, K_a, T_a, r_a))
+
+        # Price is increasing in volatility, so the sign of diff tightens the bracket
+        hi = np.where(diff > 0, sigma, hi)
+        lo = np.where(diff < 0, sigma, lo)
+
+        # Newton on log-price keeps deep out-of-the-money quotes well scaled
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            model_price = target + diff
+            newton = sigma - np.log(model_price / target) * model_price / vega
+        inside = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        sigma = np.where(inside, newton, 0.5 * (lo + hi))
+
+    return ImpliedVolatility(
+        volatility=volatility, converged=converged, within_bounds=within_bounds
+    )
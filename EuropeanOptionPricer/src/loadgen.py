@@ -0,0 +1,81 @@
+import asyncio
+import json
+import time
+
+import numpy as np
+
+from cli import parse_loadgen_args
+
+
+async def open_connection(args):
+    if args.socket:
+        return await asyncio.open_unix_connection(args.socket)
+    return await asyncio.open_connection(args.host, args.port)
+
+
+async def run_client(args, client_id, latencies):
+    """Closed-loop client: sends one request, waits for the price, repeats."""
+    rng = np.random.default_rng([args.seed, client_id])
+    reader, writer = await open_connection(args)
+    for i in range(args.requests_per_connection):
+        request = {
+            "id": i,
+            "option_type": "call" if rng.random() < 0.5 else "put",
+            "spot_price": 100.0,
+            "strike_price": float(rng.uniform(50, 150)),
+            "time_to_maturity": float(rng.uniform(0.01, 2.0)),
+            "risk_free_rate": 0.05,
+            "volatility": float(rng.uniform(0.05, 0.8)),
+        }
+        start = time.perf_counter()
+        writer.write((json.dumps(request) + "\n").encode())
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+    writer.close()
+    await writer.wait_closed()
+
+
+async def fetch_server_metrics(args):
+    reader, writer = await open_connection(args)
+    writer.write(b'{"op": "metrics"}\n')
+    response = json.loads(await reader.readline())
+    writer.close()
+    await writer.wait_closed()
+    return response["metrics"]
+
+
+async def run(args):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            run_client(args, client_id, latencies)
+            for client_id in range(args.connections)
+        )
+    )
+    elapsed = time.perf_counter() - start
+
+    latencies_ms = np.array(latencies) * 1e3
+    print("\n--- Load Generator Results ---")
+    print(f"Connections: {args.connections}")
+    print(f"Requests: {len(latencies):,} in {elapsed:.3f}s")
+    print(f"Throughput: {len(latencies) / elapsed:,.0f} requests/s")
+    print(
+        "Client latency (ms): "
+        f"p50 {np.percentile(latencies_ms, 50):.3f}, "
+        f"p95 {np.percentile(latencies_ms, 95):.3f}, "
+        f"p99 {np.percentile(latencies_ms, 99):.3f}"
+    )
+    print("\n--- Server Metrics ---")
+    for name, value in (await fetch_server_metrics(args)).items():
+        print(f"{name}: {value}")
+
+
+def main():
+    asyncio.run(run(parse_loadgen_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,45 @@
+from american import longstaff_schwartz
 from cli import parse_args
-from model import EuropeanOptionPricerModel
+from engine import parallel_monte_carlo
+from model import GREEKS, EuropeanOptionPricerModel
+
+
+def print_monte_carlo(label, estimate, confidence):
+    print(f"Monte Carlo {label} Price:{estimate.price:.5f}")
+    print(
+        f"  Std Error: {estimate.std_error:.5f}, "
+        f"{confidence:.0%} CI: [{estimate.ci_low:.5f}, {estimate.ci_high:.5f}], "
+        f"Paths: {estimate.num_simulations:,}"
+    )
+    if hasattr(estimate, "elapsed_seconds"):
+        print(
+            f"  Exercise Dates: {estimate.num_exercise_dates}, "
+            f"Time: {estimate.elapsed_seconds:.2f}s"
+        )
+
+
+def print_greeks(label, model, args):
+    analytic = model.bsm_greeks(label.lower())
+    print(f"\n--- {label} Greeks ---")
+    if model.time_to_maturity == 0:
+        for name in GREEKS:
+            print(f"{name.capitalize():>6}: BSM {analytic[name]:>11.5f}")
+        return
+
+    estimator = args.greeks_estimator.replace("-", "_")
+    simulated = model.monte_carlo_greeks(
+        label.lower(),
+        args.num_simulations,
+        estimator=estimator,
+        confidence=args.confidence,
+        seed=args.seed,
+    )
+    for name in GREEKS:
+        print(
+            f"{name.capitalize():>6}: BSM {analytic[name]:>11.5f} | "
+            f"MC ({args.greeks_estimator}) {simulated[name].price:>11.5f} "
+            f"± {simulated[name].std_error:.5f}"
+        )
 
 
 def main():
@@ -14,6 +54,7 @@ def main():
     sigma = args.volatility
     num_simulations = args.num_simulations
     option_type = args.option_type
+    variance_reduction = args.variance_reduction.replace("-", "_")
 
     print("\n--- Option Inputs ---")
     print(f"Option Type: {option_type.capitalize()}")
@@ -23,6 +64,16 @@ def main():
     print(f"Risk-Free Rate (r): {r:.4f} ({(r * 100):.2f}%)")
     print(f"Volatility (sigma): {sigma:.4f} ({(sigma * 100):.2f}%)")
     print(f"MC Simulations: {num_simulations:,}")
+    print(f"Exercise: {args.exercise.capitalize()}")
+    if args.exercise == "american":
+        print(f"Exercise Dates: {args.exercise_dates}")
+    print(f"Variance Reduction: {args.variance_reduction}")
+    if args.sampler != "pseudo":
+        print(f"Sampler: {args.sampler} ({args.qmc_replicates} replicates)")
+    if args.target_std_error is not None:
+        print(f"Target Std Error: {args.target_std_error}")
+    if args.num_workers is not None:
+        print(f"Workers: {args.num_workers} (chunks of {args.chunk_size:,} paths)")
 
     model = EuropeanOptionPricerModel(
         spot_price=S0,
@@ -39,26 +90,107 @@ def main():
     bsm_price_put = None
     mc_price_put = None
 
-    if option_type in ("call", "all"):
-        bsm_price_call = model.bsm_call_price()
-        mc_price_call = model.monte_carlo_call_price(num_simulations)
+    def monte_carlo(kind):
+        if args.exercise == "american":
+            return longstaff_schwartz(
+                model,
+                kind,
+                num_simulations,
+                num_exercise_dates=args.exercise_dates,
+                confidence=args.confidence,
+                seed=args.seed,
+            )
+        if args.sampler != "pseudo":
+            return model.quasi_monte_carlo_estimate(
+                kind,
+                num_simulations,
+                sampler=args.sampler,
+                num_replicates=args.qmc_replicates,
+                confidence=args.confidence,
+                seed=args.seed,
+            )
+        if args.target_std_error is not None:
+            return model.monte_carlo_adaptive(
+                kind,
+                args.target_std_error,
+                variance_reduction=variance_reduction,
+                batch_size=args.batch_size,
+                max_simulations=num_simulations,
+                confidence=args.confidence,
+                seed=args.seed,
+            )
+        if args.num_workers is not None:
+            return parallel_monte_carlo(
+                model,
+                kind,
+                num_simulations,
+                variance_reduction=variance_reduction,
+                chunk_size=args.chunk_size,
+                num_workers=args.num_workers,
+                confidence=args.confidence,
+                seed=args.seed,
+            )
+        return model.monte_carlo_estimate(
+            kind,
+            num_simulations,
+            variance_reduction=variance_reduction,
+            confidence=args.confidence,
+            seed=args.seed,
+        )
+
+    plain_sampling = (
+        args.sampler == "pseudo"
+        and variance_reduction == "none"
+        and args.target_std_error is None
+        and args.num_workers is None
+        and args.exercise == "european"
+    )
 
-    if option_type in ("put", "all"):
-        bsm_price_put = model.bsm_put_price()
-        mc_price_put = model.monte_carlo_put_price(num_simulations)
+    if option_type == "all" and plain_sampling:
+        # Price both payoffs on one set of terminal prices (common random numbers)
+        bsm_price_call, bsm_price_put = model.bsm_prices()
+        estimates = model.monte_carlo_payoffs(
+            K,
+            num_simulations,
+            put_via_parity=args.put_via_parity,
+            confidence=args.confidence,
+            seed=args.seed,
+        )
+        mc_price_call = estimates["call"][0]
+        mc_price_put = estimates["put"][0]
+    else:
+        if option_type in ("call", "all") or args.put_via_parity:
+            mc_price_call = monte_carlo("call")
+        if option_type in ("call", "all"):
+            bsm_price_call = model.bsm_call_price()
+
+        if option_type in ("put", "all"):
+            bsm_price_put = model.bsm_put_price()
+            if args.put_via_parity:
+                mc_price_put = model.put_from_call_estimate(mc_price_call)
+            else:
+                mc_price_put = monte_carlo("put")
+            if option_type == "put":
+                mc_price_call = None
 
     print("\n--- Results ---")
     if bsm_price_call is not None:
         print(f"Black-Scholes Call Price: {bsm_price_call:.5f}")
 
     if mc_price_call is not None:
-        print(f"Monte Carlo Call Price:{mc_price_call:.5f}")
+        print_monte_carlo("Call", mc_price_call, args.confidence)
 
     if bsm_price_put is not None:
         print(f"Black-Scholes Put Price:{bsm_price_put:.5f}")
 
     if mc_price_put is not None:
-        print(f"Monte Carlo Put Price:{mc_price_put:.5f}")
+        print_monte_carlo("Put", mc_price_put, args.confidence)
+
+    if args.greeks:
+        if option_type in ("call", "all"):
+            print_greeks("Call", model, args)
+        if option_type in ("put", "all"):
+            print_greeks("Put", model, args)
 
 
 if __name__ == "__main__":
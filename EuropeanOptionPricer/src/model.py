@@ -1,62 +1,285 @@
-from scipy.stats import norm
+from collections import OrderedDict
+from statistics import NormalDist
+from typing import NamedTuple
+
 import numpy as np
 from numpy import log, sqrt, exp
 
+# SciPy is imported inside the functions that need it, so importing the model
+# (e.g. just to print a result or start the server) stays fast.
+
+VARIANCE_REDUCTION_METHODS = (
+    "none",
+    "antithetic",
+    "control_variate",
+    "moment_matching",
+)
+
+QMC_SAMPLERS = ("sobol", "halton")
+
+GREEKS = ("delta", "gamma", "vega", "theta", "rho")
+
+GREEK_ESTIMATORS = ("pathwise", "likelihood_ratio")
+
+
+class MonteCarloEstimate(NamedTuple):
+    """Monte Carlo price with its standard error and confidence interval."""
+
+    price: float
+    std_error: float
+    ci_low: float
+    ci_high: float
+    num_simulations: int
+
+
+def _scalar_or_array(values):
+    """Unwraps 0-d results so scalar inputs still return plain numbers."""
+    return values[()] if np.ndim(values) == 0 else values
+
+
+def _normal_pdf(x):
+    return exp(-0.5 * x**2) / sqrt(2 * np.pi)
+
+
+def _summarize_samples(samples, confidence):
+    """Mean of i.i.d. samples as a MonteCarloEstimate with a normal CI."""
+    n = len(samples)
+    mean = np.mean(samples)
+    std_error = np.std(samples, ddof=1) / sqrt(n) if n > 1 else 0.0
+    half_width = NormalDist().inv_cdf(0.5 + confidence / 2) * std_error
+    return MonteCarloEstimate(
+        price=float(mean),
+        std_error=float(std_error),
+        ci_low=float(mean - half_width),
+        ci_high=float(mean + half_width),
+        num_simulations=n,
+    )
+
+
+class _PayoffMoments:
+    """Streaming means and co-moments of payoff samples and a control.
+
+    Batches are merged with Chan's parallel update, so the adaptive pricer and
+    the chunked engine can keep adding paths without storing them.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean_y = 0.0
+        self.mean_x = 0.0
+        self.m2_yy = 0.0
+        self.m2_xx = 0.0
+        self.m2_xy = 0.0
+
+    def update(self, y, x):
+        """Folds a batch of payoff samples ``y`` and controls ``x`` in."""
+        batch = _PayoffMoments()
+        batch.count = len(y)
+        batch.mean_y = np.mean(y)
+        batch.mean_x = np.mean(x)
+        dy = y - batch.mean_y
+        dx = x - batch.mean_x
+        batch.m2_yy = np.dot(dy, dy)
+        batch.m2_xx = np.dot(dx, dx)
+        batch.m2_xy = np.dot(dy, dx)
+        self.merge(batch)
+
+    def merge(self, other):
+        """Combines another accumulator into this one (Chan et al.)."""
+        n_a = self.count
+        n_b = other.count
+        n = n_a + n_b
+        if n_b == 0:
+            return
+        delta_y = other.mean_y - self.mean_y
+        delta_x = other.mean_x - self.mean_x
+        weight = n_a * n_b / n
+
+        self.m2_yy += other.m2_yy + delta_y**2 * weight
+        self.m2_xx += other.m2_xx + delta_x**2 * weight
+        self.m2_xy += other.m2_xy + delta_y * delta_x * weight
+        self.mean_y += delta_y * n_b / n
+        self.mean_x += delta_x * n_b / n
+        self.count = n
+
+    def estimate(self, control_mean=None):
+        """Returns the (price, standard error) pair, optionally control-adjusted."""
+        n = self.count
+        if control_mean is None or self.m2_xx == 0:
+            variance = self.m2_yy / (n - 1) if n > 1 else 0.0
+            return self.mean_y, sqrt(max(variance, 0.0) / n)
+
+        beta = self.m2_xy / self.m2_xx
+        price = self.mean_y - beta * (self.mean_x - control_mean)
+        residual = (self.m2_yy - beta * self.m2_xy) / (n - 2) if n > 2 else 0.0
+        return price, sqrt(max(residual, 0.0) / n)
+
+
+class TerminalPriceCache:
+    """Bounded LRU cache of simulated terminal prices.
+
+    Entries are keyed by ``(S0, T, r, sigma, num_simulations, seed)`` and
+    evicted least-recently-used first once either ``max_entries`` or
+    ``max_bytes`` is exceeded. Cached arrays are read-only so payoffs
+    evaluated on them cannot corrupt later lookups.
+    """
+
+    def __init__(self, max_entries=8, max_bytes=512 * 2**20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_simulate(self, key, simulate):
+        """Returns the cached array for ``key``, simulating it on a miss."""
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        values = simulate()
+        values.flags.writeable = False
+        self._entries[key] = values
+        self._nbytes += values.nbytes
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._nbytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+        return values
+
+    def clear(self):
+        self._entries.clear()
+        self._nbytes = 0
+
+
+_terminal_price_cache = TerminalPriceCache()
+
 
 class EuropeanOptionPricerModel:
     def __init__(
         self, spot_price, strike_price, time_to_maturity, risk_free_rate, volatility
     ):
-        """Initializes the pricing model with option parameters."""
+        """Initializes the pricing model with option parameters.
+
+        Every parameter may be a scalar or a NumPy array; arrays are broadcast
+        against each other so one model can price a whole option chain.
+        """
         self.spot_price = spot_price
         self.strike_price = strike_price
         self.time_to_maturity = time_to_maturity
         self.risk_free_rate = risk_free_rate
         self.volatility = volatility
 
+    def _broadcast_parameters(self):
+        """Private helper to broadcast all parameters to float arrays."""
+        return np.broadcast_arrays(
+            *(
+                np.asarray(value, dtype=float)
+                for value in (
+                    self.spot_price,
+                    self.strike_price,
+                    self.time_to_maturity,
+                    self.risk_free_rate,
+                    self.volatility,
+                )
+            )
+        )
+
     def _calculate_d1_d2(self):
-        """Private helper method to calculate d1 and d2."""
-        S = self.spot_price
-        K = self.strike_price
-        T = self.time_to_maturity
-        r = self.risk_free_rate
-        sigma = self.volatility
+        """Private helper method to calculate d1 and d2 element-wise."""
+        S, K, T, r, sigma = self._broadcast_parameters()
+
+        # Handle T=0 edge case per element to avoid division by zero
+        expired = T == 0
+        T = np.where(expired, 1.0, T)
+
+        vol_sqrt_T = sigma * sqrt(T)
+        d1 = (log(S / K) + (r + (sigma**2 / 2)) * T) / vol_sqrt_T
+        d2 = d1 - vol_sqrt_T
 
-        # Handle T=0 edge case to avoid division by zero
-        if T == 0:
-            return np.inf if S > K else -np.inf, np.inf if S > K else -np.inf
+        expired_d = np.where(S > K, np.inf, -np.inf)
+        return np.where(expired, expired_d, d1), np.where(expired, expired_d, d2)
 
-        d1 = (log(S / K) + (r + (sigma**2 / 2)) * T) / (sigma * sqrt(T))
-        d2 = d1 - sigma * sqrt(T)
-        return d1, d2
+    def bsm_prices(self):
+        """Calculates BSM call and put prices in one pass, sharing d1/d2."""
+        from scipy.special import ndtr
+
+        S, K, T, r, _ = self._broadcast_parameters()
+        d1, d2 = self._calculate_d1_d2()
+
+        discounted_strike = K * exp(-r * T)
+        call_price = S * ndtr(d1) - discounted_strike * ndtr(d2)
+        put_price = discounted_strike * ndtr(-d2) - S * ndtr(-d1)
+
+        # Expired contracts are worth their intrinsic value
+        expired = T == 0
+        call_price = np.where(expired, np.maximum(S - K, 0), call_price)
+        put_price = np.where(expired, np.maximum(K - S, 0), put_price)
+        return _scalar_or_array(call_price), _scalar_or_array(put_price)
 
     def bsm_call_price(self):
         """Calculates the BSM price for a European call option."""
-        S = self.spot_price
-        K = self.strike_price
-        T = self.time_to_maturity
-        r = self.risk_free_rate
-
-        if T == 0:
-            return np.maximum(S - K, 0)
+        from scipy.special import ndtr
 
+        S, K, T, r, _ = self._broadcast_parameters()
         d1, d2 = self._calculate_d1_d2()
-        call_price = S * norm.cdf(d1) - K * exp(-r * T) * norm.cdf(d2)
-        return call_price
+
+        call_price = S * ndtr(d1) - K * exp(-r * T) * ndtr(d2)
+        call_price = np.where(T == 0, np.maximum(S - K, 0), call_price)
+        return _scalar_or_array(call_price)
 
     def bsm_put_price(self):
         """Calculates the BSM price for a European put option."""
-        S = self.spot_price
-        K = self.strike_price
-        T = self.time_to_maturity
-        r = self.risk_free_rate
+        from scipy.special import ndtr
+
+        S, K, T, r, _ = self._broadcast_parameters()
+        d1, d2 = self._calculate_d1_d2()
+
+        put_price = K * exp(-r * T) * ndtr(-d2) - S * ndtr(-d1)
+        put_price = np.where(T == 0, np.maximum(K - S, 0), put_price)
+        return _scalar_or_array(put_price)
+
+    def bsm_greeks(self, option_type):
+        """Calculates closed-form BSM delta/gamma/vega/theta/rho element-wise.
 
-        if T == 0:
-            return np.maximum(K - S, 0)
+        Theta is per year of calendar time and vega/rho are per unit (not per
+        percentage point) of volatility/rate. Expired contracts keep an
+        intrinsic delta and have zero gamma, vega, theta and rho.
+        """
+        from scipy.special import ndtr
 
+        S, K, T, r, sigma = self._broadcast_parameters()
         d1, d2 = self._calculate_d1_d2()
-        put_price = K * exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
-        return put_price
+
+        expired = T == 0
+        sqrt_T = sqrt(np.where(expired, 1.0, T))
+        pdf_d1 = _normal_pdf(d1)
+        discounted_strike = K * exp(-r * T)
+
+        gamma = pdf_d1 / (S * sigma * sqrt_T)
+        vega = S * pdf_d1 * sqrt_T
+        time_decay = -S * pdf_d1 * sigma / (2 * sqrt_T)
+        if option_type == "call":
+            delta = ndtr(d1)
+            theta = time_decay - r * discounted_strike * ndtr(d2)
+            rho = T * discounted_strike * ndtr(d2)
+        else:
+            delta = ndtr(d1) - 1
+            theta = time_decay + r * discounted_strike * ndtr(-d2)
+            rho = -T * discounted_strike * ndtr(-d2)
+
+        greeks = {
+            "delta": delta,
+            "gamma": np.where(expired, 0.0, gamma),
+            "vega": np.where(expired, 0.0, vega),
+            "theta": np.where(expired, 0.0, theta),
+            "rho": np.where(expired, 0.0, rho),
+        }
+        return {name: _scalar_or_array(value) for name, value in greeks.items()}
 
     def _simulate_terminal_prices(self, num_simulations):
         """Private helper to simulate all terminal prices."""
@@ -73,6 +296,325 @@ class EuropeanOptionPricerModel:
         S_T = S0 * exp((r - 0.5 * sigma**2) * T + sigma * sqrt(T) * Z)
         return S_T
 
+    def _draw_normals(self, num_simulations, variance_reduction, rng):
+        """Private helper to draw standard normals for a variance-reduction mode."""
+        if variance_reduction == "antithetic":
+            Z = rng.standard_normal((num_simulations + 1) // 2)
+            return np.stack([Z, -Z])
+
+        Z = rng.standard_normal(num_simulations)
+        if variance_reduction == "moment_matching" and num_simulations > 1:
+            # Force the sample to have exactly zero mean and unit variance
+            Z = (Z - Z.mean()) / Z.std()
+        return Z
+
+    def _discounted_samples(
+        self, option_type, num_simulations, variance_reduction, rng
+    ):
+        """Private helper returning discounted payoff samples and their control.
+
+        The control is the discounted terminal price, whose expectation is the
+        spot price. Antithetic pairs are averaged into a single sample.
+        """
+        Z = self._draw_normals(num_simulations, variance_reduction, rng)
+        y, x = self._discounted_payoffs(option_type, Z)
+        if variance_reduction == "antithetic":
+            y, x = y.mean(axis=0), x.mean(axis=0)
+        return y, x
+
+    def _discounted_payoffs(self, option_type, Z):
+        """Private helper mapping normals to discounted payoffs and terminal prices."""
+        S0 = self.spot_price
+        K = self.strike_price
+        T = self.time_to_maturity
+        r = self.risk_free_rate
+        sigma = self.volatility
+
+        S_T = S0 * exp((r - 0.5 * sigma**2) * T + sigma * sqrt(T) * Z)
+
+        if option_type == "call":
+            payoffs = np.maximum(S_T - K, 0)
+        else:
+            payoffs = np.maximum(K - S_T, 0)
+
+        discount = exp(-r * T)
+        return discount * payoffs, discount * S_T
+
+    def _estimate(self, moments, variance_reduction, num_simulations, confidence):
+        """Private helper to turn accumulated moments into a MonteCarloEstimate."""
+        control_mean = (
+            self.spot_price if variance_reduction == "control_variate" else None
+        )
+        price, std_error = moments.estimate(control_mean)
+        half_width = NormalDist().inv_cdf(0.5 + confidence / 2) * std_error
+        return MonteCarloEstimate(
+            price=float(price),
+            std_error=float(std_error),
+            ci_low=float(price - half_width),
+            ci_high=float(price + half_width),
+            num_simulations=int(num_simulations),
+        )
+
+    def monte_carlo_estimate(
+        self,
+        option_type,
+        num_simulations,
+        variance_reduction="none",
+        confidence=0.95,
+        seed=None,
+    ):
+        """Calculates an MC price with standard error for a fixed path budget.
+
+        ``variance_reduction`` is one of ``VARIANCE_REDUCTION_METHODS``.
+        """
+        if variance_reduction not in VARIANCE_REDUCTION_METHODS:
+            raise ValueError(f"Unknown variance reduction: {variance_reduction}")
+
+        rng = np.random.default_rng(seed)
+        moments = _PayoffMoments()
+        moments.update(
+            *self._discounted_samples(
+                option_type, num_simulations, variance_reduction, rng
+            )
+        )
+        return self._estimate(moments, variance_reduction, num_simulations, confidence)
+
+    def monte_carlo_adaptive(
+        self,
+        option_type,
+        target_std_error,
+        variance_reduction="none",
+        batch_size=100_000,
+        max_simulations=100_000_000,
+        confidence=0.95,
+        seed=None,
+    ):
+        """Adds batches of paths until the standard error reaches the target.
+
+        Stops early once ``target_std_error`` is met, or after
+        ``max_simulations`` paths, whichever comes first.
+        """
+        if variance_reduction not in VARIANCE_REDUCTION_METHODS:
+            raise ValueError(f"Unknown variance reduction: {variance_reduction}")
+        if max_simulations < 1 or batch_size < 1:
+            raise ValueError("max_simulations and batch_size must be positive")
+
+        rng = np.random.default_rng(seed)
+        moments = _PayoffMoments()
+        num_simulations = 0
+        while num_simulations < max_simulations:
+            n = min(batch_size, max_simulations - num_simulations)
+            moments.update(
+                *self._discounted_samples(option_type, n, variance_reduction, rng)
+            )
+            num_simulations += n
+
+            estimate = self._estimate(
+                moments, variance_reduction, num_simulations, confidence
+            )
+            if estimate.std_error <= target_std_error:
+                break
+        return estimate
+
+    def quasi_monte_carlo_estimate(
+        self,
+        option_type,
+        num_simulations,
+        sampler="sobol",
+        num_replicates=16,
+        confidence=0.95,
+        seed=None,
+    ):
+        """Calculates a randomized quasi-Monte Carlo price with an error estimate.
+
+        The budget is split over ``num_replicates`` independently scrambled
+        low-discrepancy sequences mapped to normals by the inverse CDF. The
+        spread of the replicate prices gives the standard error. Sobol
+        replicates are rounded up to a power of two to keep their balance
+        properties, so slightly more than ``num_simulations`` paths may be used.
+        """
+        from scipy.special import ndtri, stdtrit
+        from scipy.stats import qmc
+
+        if sampler not in QMC_SAMPLERS:
+            raise ValueError(f"Unknown QMC sampler: {sampler}")
+        if num_replicates < 2:
+            raise ValueError("At least two replicates are needed for an error bar")
+
+        points_per_replicate = max(1, num_simulations // num_replicates)
+        seed_seqs = np.random.SeedSequence(seed).spawn(num_replicates)
+
+        replicate_prices = np.empty(num_replicates)
+        for i, seed_seq in enumerate(seed_seqs):
+            rng = np.random.default_rng(seed_seq)
+            if sampler == "sobol":
+                m = int(np.ceil(np.log2(points_per_replicate)))
+                U = qmc.Sobol(d=1, scramble=True, seed=rng).random_base2(m)
+            else:
+                U = qmc.Halton(d=1, scramble=True, seed=rng).random(
+                    points_per_replicate
+                )
+            # Keep the inverse CDF finite at the edges of the unit interval
+            U = np.clip(U[:, 0], np.finfo(float).tiny, 1 - np.finfo(float).eps)
+            y, _ = self._discounted_payoffs(option_type, ndtri(U))
+            replicate_prices[i] = np.mean(y)
+
+        price = replicate_prices.mean()
+        std_error = replicate_prices.std(ddof=1) / sqrt(num_replicates)
+        # Few replicates, so use Student-t rather than normal quantiles
+        half_width = stdtrit(num_replicates - 1, 0.5 + confidence / 2) * std_error
+        return MonteCarloEstimate(
+            price=float(price),
+            std_error=float(std_error),
+            ci_low=float(price - half_width),
+            ci_high=float(price + half_width),
+            num_simulations=int(len(U) * num_replicates),
+        )
+
+    def monte_carlo_greeks(
+        self,
+        option_type,
+        num_simulations,
+        estimator="pathwise",
+        confidence=0.95,
+        seed=None,
+    ):
+        """Calculates the MC price and first-order Greeks from one simulation.
+
+        Every sensitivity is an expectation over the same terminal prices as
+        the price, so no bump-and-reprice runs are needed. ``pathwise``
+        differentiates the payoff along each path (gamma uses the mixed
+        likelihood-ratio/pathwise estimator, as the payoff derivative is a
+        step). ``likelihood_ratio`` weights the payoff by the score of the
+        lognormal density, which also works for discontinuous payoffs.
+
+        Returns a dict of MonteCarloEstimate keyed by ``"price"`` and
+        ``GREEKS``.
+        """
+        if estimator not in GREEK_ESTIMATORS:
+            raise ValueError(f"Unknown Greek estimator: {estimator}")
+        if self.time_to_maturity == 0:
+            raise ValueError("Monte Carlo Greeks need a positive time to maturity")
+
+        S0 = self.spot_price
+        K = self.strike_price
+        T = self.time_to_maturity
+        r = self.risk_free_rate
+        sigma = self.volatility
+
+        rng = np.random.default_rng(seed)
+        Z = rng.standard_normal(num_simulations)
+        y, _ = self._discounted_payoffs(option_type, Z)
+        S_T = S0 * exp((r - 0.5 * sigma**2) * T + sigma * sqrt(T) * Z)
+        discount = exp(-r * T)
+        vol_sqrt_T = sigma * sqrt(T)
+
+        if estimator == "pathwise":
+            # d(payoff)/d(S_T) is +1 for ITM calls and -1 for ITM puts
+            if option_type == "call":
+                slope = discount * (S_T > K)
+            else:
+                slope = -discount * (S_T < K)
+            samples = {
+                "delta": slope * S_T / S0,
+                "gamma": slope * S_T / S0**2 * (Z / vol_sqrt_T - 1),
+                "vega": slope * S_T * (sqrt(T) * Z - sigma * T),
+                "theta": r * y
+                - slope * S_T * (r - 0.5 * sigma**2 + sigma * Z / (2 * sqrt(T))),
+                "rho": T * (slope * S_T - y),
+            }
+        else:
+            samples = {
+                "delta": y * Z / (S0 * vol_sqrt_T),
+                "gamma": y * (Z**2 - 1 - Z * vol_sqrt_T) / (S0 * vol_sqrt_T) ** 2,
+                "vega": y * ((Z**2 - 1) / sigma - Z * sqrt(T)),
+                "theta": -y
+                * (Z * (r - 0.5 * sigma**2) / vol_sqrt_T + (Z**2 - 1) / (2 * T) - r),
+                "rho": y * (Z * sqrt(T) / sigma - T),
+            }
+
+        results = {"price": _summarize_samples(y, confidence)}
+        for name in GREEKS:
+            results[name] = _summarize_samples(samples[name], confidence)
+        return results
+
+    def cached_terminal_prices(self, num_simulations, seed, cache=None):
+        """Simulates terminal prices once per (S0, T, r, sigma, n, seed).
+
+        Unseeded requests are never cached since they are not reproducible.
+        """
+        S0 = self.spot_price
+        T = self.time_to_maturity
+        r = self.risk_free_rate
+        sigma = self.volatility
+
+        def simulate():
+            Z = np.random.default_rng(seed).standard_normal(num_simulations)
+            return S0 * exp((r - 0.5 * sigma**2) * T + sigma * sqrt(T) * Z)
+
+        if seed is None:
+            return simulate()
+        cache = _terminal_price_cache if cache is None else cache
+        key = (S0, T, r, sigma, num_simulations, seed)
+        return cache.get_or_simulate(key, simulate)
+
+    def put_from_call_estimate(self, call_estimate, strike_price=None):
+        """Shifts a call MonteCarloEstimate to the put via put-call parity.
+
+        The shift ``K exp(-rT) - S0`` is exact, so the standard error carries
+        over unchanged.
+        """
+        K = self.strike_price if strike_price is None else strike_price
+        shift = K * exp(-self.risk_free_rate * self.time_to_maturity) - self.spot_price
+        return call_estimate._replace(
+            price=call_estimate.price + shift,
+            ci_low=call_estimate.ci_low + shift,
+            ci_high=call_estimate.ci_high + shift,
+        )
+
+    def monte_carlo_payoffs(
+        self,
+        strikes,
+        num_simulations,
+        option_types=("call", "put"),
+        put_via_parity=False,
+        confidence=0.95,
+        seed=None,
+        cache=None,
+    ):
+        """Prices calls/puts at several strikes on one set of terminal prices.
+
+        All payoffs share common random numbers, so differences between them
+        (spreads, call vs put) have far less noise than separate runs. With
+        ``put_via_parity`` the puts are derived from the simulated calls as
+        ``C - S0 + K exp(-rT)`` instead of being simulated.
+
+        Returns a dict mapping each option type to a list of
+        MonteCarloEstimate aligned with ``strikes``.
+        """
+        S_T = self.cached_terminal_prices(num_simulations, seed, cache)
+        T = self.time_to_maturity
+        r = self.risk_free_rate
+        discount = exp(-r * T)
+
+        simulate_calls = "call" in option_types or (
+            put_via_parity and "put" in option_types
+        )
+        results = {option_type: [] for option_type in option_types}
+        for K in np.atleast_1d(strikes):
+            if simulate_calls:
+                call = _summarize_samples(discount * np.maximum(S_T - K, 0), confidence)
+                if "call" in option_types:
+                    results["call"].append(call)
+            if "put" not in option_types:
+                continue
+            if put_via_parity:
+                put = self.put_from_call_estimate(call, K)
+            else:
+                put = _summarize_samples(discount * np.maximum(K - S_T, 0), confidence)
+            results["put"].append(put)
+        return results
+
     def monte_carlo_call_price(self, num_simulations):
         """Calculates the MC price for a European call option."""
         S_T = self._simulate_terminal_prices(num_simulations)
@@ -96,3 +638,36 @@ class EuropeanOptionPricerModel:
         payoffs = np.maximum(K - S_T, 0)
         price = exp(-r * T) * np.mean(payoffs)
         return price
+
+
+def price_option_chain(
+    spot_price, strike_price, time_to_maturity, risk_free_rate, volatility
+):
+    """Vectorized BSM call/put prices for broadcastable parameter arrays.
+
+    Prices the whole chain with one model instead of one object per contract.
+    Returns a ``(call_prices, put_prices)`` tuple shaped like the broadcast
+    inputs.
+    """
+    model = EuropeanOptionPricerModel(
+        spot_price=spot_price,
+        strike_price=strike_price,
+        time_to_maturity=time_to_maturity,
+        risk_free_rate=risk_free_rate,
+        volatility=volatility,
+    )
+    return model.bsm_prices()
+
+
+def option_chain_greeks(
+    spot_price, strike_price, time_to_maturity, risk_free_rate, volatility, option_type
+):
+    """Vectorized closed-form Greeks for broadcastable parameter arrays."""
+    model = EuropeanOptionPricerModel(
+        spot_price=spot_price,
+        strike_price=strike_price,
+        time_to_maturity=time_to_maturity,
+        risk_free_rate=risk_free_rate,
+        volatility=volatility,
+    )
+    return model.bsm_greeks(option_type)
@@ -0,0 +1,241 @@
+import asyncio
+import json
+import signal
+import time
+from collections import deque
+
+import numpy as np
+
+from cli import parse_server_args
+from model import price_option_chain
+
+# Fields every pricing request must carry, in price_option_chain order
+REQUEST_FIELDS = (
+    "spot_price",
+    "strike_price",
+    "time_to_maturity",
+    "risk_free_rate",
+    "volatility",
+)
+
+
+class ServerMetrics:
+    """Rolling per-request latency and batch-size statistics."""
+
+    def __init__(self, window=100_000):
+        self.started = time.perf_counter()
+        self.num_requests = 0
+        self.num_batches = 0
+        self.latencies = deque(maxlen=window)
+        self.batch_sizes = deque(maxlen=window)
+
+    def record_batch(self, size):
+        self.num_batches += 1
+        self.batch_sizes.append(size)
+
+    def record_request(self, latency):
+        self.num_requests += 1
+        self.latencies.append(latency)
+
+    def snapshot(self):
+        latencies_ms = np.array(self.latencies) * 1e3
+        batch_sizes = np.array(self.batch_sizes)
+        elapsed = time.perf_counter() - self.started
+        snapshot = {
+            "requests": self.num_requests,
+            "batches": self.num_batches,
+            "requests_per_second": self.num_requests / elapsed if elapsed else 0.0,
+        }
+        if len(latencies_ms):
+            snapshot.update(
+                {
+                    "latency_ms_p50": float(np.percentile(latencies_ms, 50)),
+                    "latency_ms_p95": float(np.percentile(latencies_ms, 95)),
+                    "latency_ms_p99": float(np.percentile(latencies_ms, 99)),
+                    "latency_ms_max": float(latencies_ms.max()),
+                }
+            )
+        if len(batch_sizes):
+            snapshot.update(
+                {
+                    "batch_size_mean": float(batch_sizes.mean()),
+                    "batch_size_max": int(batch_sizes.max()),
+                }
+            )
+        return snapshot
+
+
+class MicroBatcher:
+    """Collects concurrent pricing requests into vectorized batches.
+
+    The first request of a batch waits at most ``batch_window`` seconds for
+    others to arrive, so a lone request pays that latency once while bursts
+    are priced together in a single ``price_option_chain`` call.
+    """
+
+    def __init__(self, metrics, max_batch_size=4096, batch_window=0.001):
+        self.metrics = metrics
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self._queue = asyncio.Queue()
+
+    async def price(self, params, is_call):
+        """Queues one contract and waits for its price."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((params, is_call, future))
+        return await future
+
+    async def _collect(self):
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.batch_window
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def run(self):
+        while True:
+            batch = await self._collect()
+            try:
+                params = np.array([item[0] for item in batch], dtype=float)
+                is_call = np.array([item[1] for item in batch])
+                calls, puts = price_option_chain(*params.T)
+                prices = np.where(is_call, calls, puts)
+            except Exception as e:
+                # fail the whole batch rather than leave its clients waiting
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.metrics.record_batch(len(batch))
+            for (_, _, future), price in zip(batch, prices):
+                if not future.done():
+                    future.set_result(float(price))
+
+
+def _parse_request(request):
+    """Validates a pricing request, returning (params, is_call)."""
+    option_type = request.get("option_type", "call")
+    if option_type not in ("call", "put"):
+        raise ValueError(f"option_type must be 'call' or 'put', got {option_type!r}")
+    missing = [field for field in REQUEST_FIELDS if field not in request]
+    if missing:
+        raise ValueError(f"missing fields: {', '.join(missing)}")
+    params = dict(zip(REQUEST_FIELDS, (float(request[f]) for f in REQUEST_FIELDS)))
+    bad = [field for field, value in params.items() if not np.isfinite(value)]
+    if bad:
+        raise ValueError(f"non-finite fields: {', '.join(bad)}")
+    for field in ("spot_price", "strike_price", "volatility"):
+        if params[field] <= 0:
+            raise ValueError(f"{field} must be positive, got {params[field]}")
+    if params["time_to_maturity"] < 0:
+        raise ValueError("time_to_maturity must be non-negative")
+    return list(params.values()), option_type == "call"
+
+
+async def _respond(line, batcher, metrics, writer):
+    start = time.perf_counter()
+    request_id = None
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+        request_id = request.get("id")
+        if request.get("op") == "metrics":
+            response = {"id": request_id, "metrics": metrics.snapshot()}
+        else:
+            params, is_call = _parse_request(request)
+            price = await batcher.price(params, is_call)
+            metrics.record_request(time.perf_counter() - start)
+            response = {"id": request_id, "price": price}
+        # NaN/Infinity are not JSON, so refuse them rather than emit them
+        message = json.dumps(response, allow_nan=False)
+    except Exception as e:
+        # malformed requests and failed batches alike; the id lets a
+        # pipelining client match the error to its request
+        message = json.dumps({"id": request_id, "error": str(e)})
+    writer.write((message + "\n").encode())
+    await writer.drain()
+
+
+async def handle_connection(reader, writer, batcher, metrics):
+    """Serves newline-delimited JSON requests; responses carry the request id.
+
+    Requests on one connection may be pipelined, so responses can come back
+    out of order.
+    """
+    tasks = set()
+    try:
+        while line := await reader.readline():
+            task = asyncio.create_task(_respond(line, batcher, metrics, writer))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def report_metrics(metrics, interval):
+    while True:
+        await asyncio.sleep(interval)
+        print(json.dumps(metrics.snapshot()), flush=True)
+
+
+async def serve(args):
+    metrics = ServerMetrics()
+    batcher = MicroBatcher(
+        metrics,
+        max_batch_size=args.max_batch_size,
+        batch_window=args.batch_window_ms / 1e3,
+    )
+
+    def on_connect(reader, writer):
+        return handle_connection(reader, writer, batcher, metrics)
+
+    if args.socket:
+        server = await asyncio.start_unix_server(on_connect, path=args.socket)
+        print(f"Pricing server listening on unix:{args.socket}", flush=True)
+    else:
+        server = await asyncio.start_server(on_connect, args.host, args.port)
+        print(f"Pricing server listening on {args.host}:{args.port}", flush=True)
+
+    # Stop cleanly on Ctrl-C or SIGTERM so the final metrics are reported
+    serving = asyncio.current_task()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        asyncio.get_running_loop().add_signal_handler(sig, serving.cancel)
+
+    background = [asyncio.create_task(batcher.run())]
+    if args.report_interval > 0:
+        background.append(
+            asyncio.create_task(report_metrics(metrics, args.report_interval))
+        )
+    try:
+        async with server:
+            await server.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        for task in background:
+            task.cancel()
+        print(json.dumps(metrics.snapshot()), flush=True)
+
+
+def main():
+    asyncio.run(serve(parse_server_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,5 @@
 from get_data import get_data
 import numpy as np
-import scipy.optimize
 
 
 def calculate_log_returns(price_data):
@@ -15,6 +14,143 @@ def calculate_annualized_covariance(log_returns_df):
     return log_returns_df.cov() * 252
 
 
+def _labelled(matrix, labels):
+    import pandas as pd
+
+    return pd.DataFrame(matrix, index=labels, columns=labels)
+
+
+def calculate_ledoit_wolf_covariance(log_returns_df):
+    """Sample covariance shrunk towards a scaled identity (Ledoit-Wolf 2004).
+
+    The shrinkage intensity is the optimal one estimated from the data, so
+    the result is well conditioned even with more assets than observations.
+    """
+    x = log_returns_df.to_numpy(dtype=float)
+    x = x - x.mean(axis=0)
+    num_obs, num_assets = x.shape
+    sample = x.T @ x / num_obs  # 1/T normalisation, as in the paper
+    target = np.trace(sample) / num_assets
+    # distance of the sample from the target, and how noisy the sample is:
+    # sum_t ||x_t x_t' - S||^2 expands to sum_t ||x_t||^4 - T ||S||^2
+    distance = (
+        np.sum(sample**2) - 2 * target * np.trace(sample) + num_assets * target**2
+    )
+    noise = (
+        np.sum(np.sum(x**2, axis=1) ** 2) - num_obs * np.sum(sample**2)
+    ) / num_obs**2
+    shrinkage = min(noise, distance) / distance if distance > 0 else 1.0
+    shrunk = (1 - shrinkage) * sample
+    shrunk[np.diag_indices(num_assets)] += shrinkage * target
+    return _labelled(shrunk * 252, log_returns_df.columns)
+
+
+def calculate_ewma_covariance(log_returns_df, decay=0.94):
+    """RiskMetrics-style exponentially weighted covariance (zero mean).
+
+    The weight on an observation k days old is proportional to decay**k, so
+    recent co-movements dominate (0.94 is the RiskMetrics daily decay).
+    """
+    x = log_returns_df.to_numpy(dtype=float)
+    weights = decay ** np.arange(len(x) - 1, -1, -1)
+    weights /= weights.sum()
+    cov = (x * weights[:, None]).T @ x
+    return _labelled(cov * 252, log_returns_df.columns)
+
+
+class FactorCovariance:
+    """sigma = B diag(f) B' + diag(d), kept in factor form.
+
+    B is (n, k) loadings, f the k factor variances and d the n specific
+    variances. Products with a vector cost O(n k) and the n x n matrix is
+    never formed, but ``w.T @ sigma @ w`` (so calculate_portfolio_variance)
+    and the solvers' matvec work as they do for a dense matrix.
+    """
+
+    # make ndarray @ FactorCovariance hand over to __rmatmul__
+    __array_ufunc__ = None
+
+    def __init__(self, loadings, factor_variances, specific_variances, index=None):
+        self.loadings = np.asarray(loadings, dtype=float)
+        self.factor_variances = np.asarray(factor_variances, dtype=float)
+        self.specific_variances = np.asarray(specific_variances, dtype=float)
+        self.index = index  # asset labels, if any
+        num_assets = len(self.specific_variances)
+        self.shape = (num_assets, num_assets)
+
+    def matvec(self, x):
+        # x is (n,) or (n, m)
+        x = np.asarray(x, dtype=float)
+        f, d = self.factor_variances, self.specific_variances
+        if x.ndim == 2:
+            f, d = f[:, None], d[:, None]
+        return self.loadings @ (f * (self.loadings.T @ x)) + d * x
+
+    def __matmul__(self, x):
+        return self.matvec(x)
+
+    def __rmatmul__(self, x):
+        # x' sigma = (sigma x)' as sigma is symmetric
+        return self.matvec(np.asarray(x, dtype=float).T).T
+
+    def diagonal(self):
+        return (self.loadings**2) @ self.factor_variances + self.specific_variances
+
+    def solve(self, b):
+        """sigma^-1 b via Woodbury, O(n k^2)."""
+        b = np.asarray(b, dtype=float)
+        inv_d = 1.0 / self.specific_variances
+        if b.ndim == 2:
+            inv_d = inv_d[:, None]
+        scaled = inv_d * b
+        capacitance = (
+            np.diag(1.0 / self.factor_variances)
+            + (self.loadings.T / self.specific_variances) @ self.loadings
+        )
+        return scaled - inv_d * (
+            self.loadings @ np.linalg.solve(capacitance, self.loadings.T @ scaled)
+        )
+
+    def to_dense(self):
+        # only for small universes, e.g. printing
+        dense = (self.loadings * self.factor_variances) @ self.loadings.T
+        dense[np.diag_indices(self.shape[0])] += self.specific_variances
+        return _labelled(dense, self.index)
+
+    def __repr__(self):
+        return (
+            f"FactorCovariance({self.shape[0]} assets, "
+            f"{len(self.factor_variances)} factors)"
+        )
+
+
+def calculate_factor_covariance(log_returns_df, num_factors=3):
+    """Statistical (PCA) factor model of the annualized covariance.
+
+    The top principal components of the demeaned returns are the factors and
+    what they leave unexplained is each asset's specific variance. Uses a
+    thin SVD of the (T, n) returns, so no n x n matrix is formed.
+    """
+    x = log_returns_df.to_numpy(dtype=float)
+    x = x - x.mean(axis=0)
+    num_obs = len(x)
+    _, singular_values, components = np.linalg.svd(x, full_matrices=False)
+    eigenvalues = singular_values**2 / (num_obs - 1)
+    num_factors = min(num_factors, int(np.sum(eigenvalues > 1e-12 * eigenvalues[0])))
+    loadings = components[:num_factors].T
+    factor_variances = eigenvalues[:num_factors]
+    variances = np.sum(x**2, axis=0) / (num_obs - 1)
+    specific = variances - (loadings**2) @ factor_variances
+    # a small floor keeps sigma positive definite (and invertible)
+    specific = np.maximum(specific, 1e-4 * variances.mean())
+    return FactorCovariance(
+        loadings,
+        factor_variances * 252,
+        specific * 252,
+        index=log_returns_df.columns,
+    )
+
+
 def calculate_portfolio_variance(weights, sigma):
     return weights.T @ sigma @ weights
 
@@ -27,7 +163,123 @@ def calculate_portfolio_volatility(weights, sigma):
     return np.sqrt(calculate_portfolio_variance(weights, sigma))
 
 
-def optimize_portfolio(sigma):
+def _as_matvec(sigma):
+    # the solver only needs sigma @ x, so anything with a matvec works (e.g. a
+    # structured covariance that never forms the dense matrix)
+    if hasattr(sigma, "matvec"):
+        return sigma.matvec
+    sigma = np.asarray(sigma, dtype=float)
+    return lambda x: sigma @ x
+
+
+def _largest_eigenvalue(matvec, num_assets, iterations=50, seed=0):
+    # power iteration, so the step size needs no dense eigendecomposition
+    x = np.random.default_rng(seed).standard_normal(num_assets)
+    eig = 0.0
+    for _ in range(iterations):
+        y = matvec(x)
+        norm = np.linalg.norm(y)
+        if norm == 0:
+            return 0.0
+        eig = norm / np.linalg.norm(x)
+        x = y / norm
+    return eig
+
+
+def project_to_box_simplex(v, lower=0.0, upper=1.0, total=1.0):
+    """Euclidean projection onto {w : lower <= w <= upper, sum(w) = total}.
+
+    The projection is clip(v - tau, lower, upper) for the scalar tau that hits
+    the budget. The budget is piecewise linear and decreasing in tau with
+    kinks at v - upper and v - lower, so a binary search over the sorted
+    kinks finds the linear piece, and tau is solved exactly on it.
+    """
+    lower = np.broadcast_to(lower, v.shape)
+    upper = np.broadcast_to(upper, v.shape)
+    if lower.sum() > total + 1e-12 or upper.sum() < total - 1e-12:
+        raise ValueError("box constraints are incompatible with the budget")
+
+    def budget(tau):
+        return np.clip(v - tau, lower, upper).sum()
+
+    kinks = np.sort(np.concatenate([v - upper, v - lower]))
+    lo, hi = 0, len(kinks) - 1  # budget(kinks[lo]) >= total >= budget(kinks[hi])
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if budget(kinks[mid]) >= total:
+            lo = mid
+        else:
+            hi = mid
+    # between the two kinks the free set is fixed; solve for tau on it
+    tau = 0.5 * (kinks[lo] + kinks[hi])
+    free = (v - tau > lower) & (v - tau < upper)
+    if free.any():
+        fixed = np.where(v - tau >= upper, upper, lower)[~free].sum()
+        tau = (v[free].sum() - (total - fixed)) / free.sum()
+    return np.clip(v - tau, lower, upper)
+
+
+def solve_min_variance(
+    sigma,
+    linear=None,
+    lower=0.0,
+    upper=1.0,
+    initial_weights=None,
+    lipschitz=None,
+    tol=1e-9,
+    max_iter=20_000,
+):
+    """Minimises w' sigma w + linear' w over the box-constrained simplex.
+
+    Accelerated projected gradient (FISTA with adaptive restart) using the
+    analytic gradient 2 sigma w + linear, so each iteration is one matvec.
+    Pass the previous solution as ``initial_weights`` (and ``lipschitz``) to
+    warm start a sequence of related solves. Returns (weights, iterations);
+    stops when the projected-gradient step is below ``tol`` and raises
+    ValueError if that takes more than ``max_iter`` iterations.
+    """
+    matvec = _as_matvec(sigma)
+    num_assets = sigma.shape[0]
+    linear = np.zeros(num_assets) if linear is None else np.asarray(linear, float)
+    if lipschitz is None:
+        # 2 * lambda_max bounds the gradient's Lipschitz constant; a little
+        # headroom covers the power-iteration underestimate
+        lipschitz = 2.2 * _largest_eigenvalue(matvec, num_assets)
+    step = 1.0 / max(lipschitz, 1e-12)
+
+    if initial_weights is None:
+        initial_weights = np.full(num_assets, 1.0 / num_assets)
+    w = project_to_box_simplex(np.asarray(initial_weights, float), lower, upper)
+    y, momentum = w.copy(), 1.0
+    for iteration in range(1, max_iter + 1):
+        grad = 2 * matvec(y) + linear
+        w_next = project_to_box_simplex(y - step * grad, lower, upper)
+        if np.max(np.abs(w_next - y)) <= tol:
+            return w_next, iteration
+
+        if np.dot(y - w_next, w_next - w) > 0:
+            # momentum is pointing uphill: restart the acceleration
+            momentum_next, y = 1.0, w_next.copy()
+        else:
+            momentum_next = 0.5 * (1 + np.sqrt(1 + 4 * momentum**2))
+            y = w_next + (momentum - 1) / momentum_next * (w_next - w)
+        w, momentum = w_next, momentum_next
+    raise ValueError(
+        f"Optimization failed: projected gradient did not converge in {max_iter}"
+        f" iterations (last step {np.max(np.abs(w_next - y)):.2e}, tol {tol:.0e})"
+    )
+
+
+def optimize_portfolio(sigma, method="projected_gradient", initial_weights=None):
+    # long-only minimum variance, sum(w) = 1
+    if method == "projected_gradient":
+        weights, _ = solve_min_variance(sigma, initial_weights=initial_weights)
+        return weights
+    if method != "slsqp":
+        raise ValueError("method must be 'projected_gradient' or 'slsqp'")
+
+    import scipy.optimize
+
     # number of assets from the covariance matrix
     num_assets = sigma.shape[0]
 
@@ -39,7 +291,8 @@ def optimize_portfolio(sigma):
     constraints = {"type": "eq", "fun": lambda weights: np.sum(weights) - 1}
 
     # Set an initial guess with equal eights
-    initial_weights = np.ones(num_assets) / num_assets
+    if initial_weights is None:
+        initial_weights = np.ones(num_assets) / num_assets
 
     result = scipy.optimize.minimize(
         calculate_portfolio_variance,
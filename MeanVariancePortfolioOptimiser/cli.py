@@ -25,5 +25,29 @@ def parse_args():
         type=str,
         required=True,
     )
+    parser.add_argument(
+        "--covariance",
+        help="covariance estimator (factor = PCA factor model, never dense)",
+        choices=["sample", "ledoit_wolf", "ewma", "factor"],
+        default="sample",
+    )
+    parser.add_argument(
+        "--num-factors",
+        help="number of statistical factors for --covariance factor",
+        type=int,
+        default=3,
+    )
+    parser.add_argument(
+        "--frontier-points",
+        help="number of efficient frontier portfolios to compute and plot (0 = skip)",
+        type=int,
+        default=0,
+    )
+    parser.add_argument(
+        "--max-weight",
+        help="upper bound on any single weight along the frontier",
+        type=float,
+        default=1.0,
+    )
 
     return parser.parse_args()
@@ -0,0 +1,263 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from calculations import (
+    _as_matvec,
+    _largest_eigenvalue,
+    calculate_portfolio_return,
+    calculate_portfolio_variance,
+    solve_min_variance,
+)
+
+# Efficient frontier: for each target return r,
+#   min w' S w  s.t.  sum(w) = 1, mu' w = r, lower <= w <= upper.
+# Where the box constraints don't bind, the classic two-fund closed form is
+# exact. Elsewhere the return constraint is priced by a multiplier and each
+# subproblem is the box-simplex QP of solve_min_variance. Targets are
+# walked in order so every solve warm-starts from its neighbour, and
+# independent segments of the frontier run in separate processes.
+
+
+class Frontier(NamedTuple):
+    target_returns: np.ndarray
+    returns: np.ndarray
+    volatilities: np.ndarray
+    weights: np.ndarray  # (num_points, num_assets)
+    closed_form: np.ndarray  # True where the two-fund solution was used
+
+
+def _two_fund(sigma, mu):
+    # w(r) = ((C - rB) S^-1 1 + (rA - B) S^-1 mu) / D, or None if S is singular
+    ones = np.ones(len(mu))
+    try:
+        if hasattr(sigma, "solve"):
+            inv_ones, inv_mu = sigma.solve(ones), sigma.solve(mu)
+        else:
+            inv_ones, inv_mu = np.linalg.solve(
+                np.asarray(sigma), np.column_stack([ones, mu])
+            ).T
+    except np.linalg.LinAlgError:
+        return None
+    A, B, C = ones @ inv_ones, ones @ inv_mu, mu @ inv_mu
+    D = A * C - B**2
+    if not D > 0:
+        return None
+    return lambda r: ((C - r * B) * inv_ones + (r * A - B) * inv_mu) / D
+
+
+def _extreme_weights(mu, lower, upper, highest=True):
+    # start everything at its lower bound, then fill the best assets first
+    lower = np.broadcast_to(lower, mu.shape).astype(float)
+    upper = np.broadcast_to(upper, mu.shape).astype(float)
+    w = lower.copy()
+    budget = 1.0 - w.sum()
+    order = np.argsort(mu)
+    for i in order[::-1] if highest else order:
+        add = min(upper[i] - w[i], budget)
+        w[i] += add
+        budget -= add
+    return w
+
+
+def return_range(mu, lower=0.0, upper=1.0):
+    """Lowest and highest mu' w reachable on the box-constrained simplex."""
+    mu = np.asarray(mu, dtype=float)
+    return (
+        mu @ _extreme_weights(mu, lower, upper, highest=False),
+        mu @ _extreme_weights(mu, lower, upper),
+    )
+
+
+def solve_target_return(
+    sigma,
+    mu,
+    target,
+    lower=0.0,
+    upper=1.0,
+    initial_weights=None,
+    multiplier=0.0,
+    lipschitz=None,
+    step=None,
+    tol=1e-6,
+    max_outer=100,
+):
+    """Minimum variance portfolio with mu' w = target.
+
+    For a fixed multiplier m, min w' S w + m mu' w over the box-constrained
+    simplex is exactly what solve_min_variance does, and mu' w(m) falls as m
+    grows, so m is found with a bracketed secant search (Illinois) on the
+    return. ``step`` is the first move away from ``multiplier`` while
+    bracketing. Returns (weights, multiplier); pass both back in for the next
+    target to warm start.
+    """
+    if lipschitz is None:
+        lipschitz = 2.2 * _largest_eigenvalue(_as_matvec(sigma), len(mu))
+
+    def solve(m, w):
+        w, _ = solve_min_variance(
+            sigma,
+            linear=m * mu,
+            lower=lower,
+            upper=upper,
+            initial_weights=w,
+            lipschitz=lipschitz,
+            tol=tol * 1e-2,
+        )
+        return w, mu @ w - target
+
+    w, residual = solve(multiplier, initial_weights)
+    if abs(residual) <= tol:
+        return w, multiplier
+
+    # walk away from the warm start, doubling the step, until the sign flips;
+    # risk and return trade off where m * spread(mu) ~ the variance gradient
+    if step is None:
+        step = 0.2 * (w @ _as_matvec(sigma)(w)) / max(np.ptp(mu), 1e-12)
+    a, fa, w_a = multiplier, residual, w
+    b = multiplier + (step if residual > 0 else -step)
+    for _ in range(max_outer):
+        w_b, fb = solve(b, w_a)
+        if abs(fb) <= tol or np.sign(fb) != np.sign(fa):
+            break
+        a, fa, w_a = b, fb, w_b
+        step *= 2
+        b = a + (step if fa > 0 else -step)
+    if abs(fb) <= tol:
+        return w_b, b
+
+    side = 0
+    for _ in range(max_outer):
+        m = b - fb * (b - a) / (fb - fa)
+        w, residual = solve(m, w_b if abs(fb) < abs(fa) else w_a)
+        if abs(residual) <= tol or abs(b - a) <= 1e-10 * (1 + abs(m)):
+            break  # on target, or as close as the inner solves resolve
+        if np.sign(residual) == np.sign(fb):
+            b, fb, w_b = m, residual, w
+            if side == 1:
+                fa /= 2
+            side = 1
+        else:
+            a, fa, w_a = m, residual, w
+            if side == -1:
+                fb /= 2
+            side = -1
+    return w, m
+
+
+def _frontier_segment(sigma, mu, targets, lower, upper, tol):
+    two_fund = _two_fund(sigma, mu)
+    lipschitz = 2.2 * _largest_eigenvalue(_as_matvec(sigma), len(mu))
+    lowest, highest = return_range(mu, lower, upper)
+    weights = np.empty((len(targets), len(mu)))
+    closed_form = np.zeros(len(targets), dtype=bool)
+    w, multiplier = None, 0.0
+    previous = []  # (target, multiplier) of the last iterative solves
+    for i, target in enumerate(targets):
+        if not lowest - tol <= target <= highest + tol:
+            raise ValueError(
+                f"target return {target:.4g} outside [{lowest:.4g}, {highest:.4g}]"
+            )
+        if two_fund is not None:
+            candidate = two_fund(target)
+            if np.all(candidate >= lower - tol) and np.all(candidate <= upper + tol):
+                weights[i], closed_form[i] = candidate, True
+                w = np.clip(candidate, lower, upper)
+                continue
+        if target >= highest - tol or target <= lowest + tol:
+            # only the extreme portfolio gets there (the multiplier is infinite)
+            weights[i] = _extreme_weights(mu, lower, upper, target >= highest - tol)
+            continue
+        if len(previous) == 2 and previous[0][0] != previous[1][0]:
+            # the multiplier moves smoothly along the frontier, extrapolate it
+            (r0, m0), (r1, m1) = previous
+            move = (target - r1) * (m1 - m0) / (r1 - r0)
+            multiplier, step = m1 + move, 0.25 * abs(move)
+        else:
+            step = None
+        w, multiplier = solve_target_return(
+            sigma,
+            mu,
+            target,
+            lower,
+            upper,
+            initial_weights=w,
+            multiplier=multiplier,
+            lipschitz=lipschitz,
+            step=step,
+            tol=tol,
+        )
+        weights[i] = w
+        previous = previous[-1:] + [(target, multiplier)]
+    return weights, closed_form
+
+
+def efficient_frontier(
+    mu,
+    sigma,
+    num_points=100,
+    lower=0.0,
+    upper=1.0,
+    target_returns=None,
+    num_workers=None,
+    tol=1e-6,
+):
+    """Efficient frontier from the minimum-variance return to the maximum.
+
+    ``lower``/``upper`` are per-asset bounds (scalars or arrays). With more
+    than one worker the targets are split into contiguous segments, each
+    solved with warm starts in its own process.
+    """
+    mu = np.asarray(mu, dtype=float)
+    if not hasattr(sigma, "matvec"):
+        sigma = np.asarray(sigma, dtype=float)
+    if target_returns is None:
+        min_var, _ = solve_min_variance(sigma, lower=lower, upper=upper)
+        _, highest = return_range(mu, lower, upper)
+        target_returns = np.linspace(mu @ min_var, highest, num_points)
+    target_returns = np.asarray(target_returns, dtype=float)
+
+    num_workers = min(num_workers or os.cpu_count(), len(target_returns))
+    segments = np.array_split(target_returns, num_workers)
+    jobs = [(sigma, mu, segment, lower, upper, tol) for segment in segments]
+    if num_workers > 1:
+        with ProcessPoolExecutor(num_workers) as pool:
+            results = list(pool.map(_frontier_segment, *zip(*jobs)))
+    else:
+        results = [_frontier_segment(*job) for job in jobs]
+
+    weights = np.concatenate([w for w, _ in results])
+    return Frontier(
+        target_returns=target_returns,
+        returns=np.array([calculate_portfolio_return(w, mu) for w in weights]),
+        volatilities=np.sqrt([calculate_portfolio_variance(w, sigma) for w in weights]),
+        weights=weights,
+        closed_form=np.concatenate([c for _, c in results]),
+    )
+
+
+def plot_frontier(frontier, mu, sigma, tickers=None):
+    import matplotlib.pyplot as plt
+
+    mu = np.asarray(mu, dtype=float)
+    if hasattr(sigma, "diagonal"):
+        asset_vols = np.sqrt(sigma.diagonal())
+    else:
+        asset_vols = np.sqrt(np.diag(np.asarray(sigma)))
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.plot(frontier.volatilities, frontier.returns, lw=2, label="Efficient frontier")
+    ax.scatter(asset_vols, mu, color="black", zorder=3, label="Assets")
+    if tickers is not None:
+        for ticker, vol, ret in zip(tickers, asset_vols, mu):
+            ax.annotate(ticker, (vol, ret), textcoords="offset points", xytext=(4, 4))
+    ax.set_xlabel("Annualized Volatility")
+    ax.set_ylabel("Annualized Return")
+    ax.set_title("Efficient Frontier")
+    ax.legend()
+    ax.grid(alpha=0.3)
+    plt.tight_layout()
+    plt.show()
+    plt.close()
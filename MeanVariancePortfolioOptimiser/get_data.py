@@ -1,9 +1,21 @@
-import yfinance as yf
+import sys
+import warnings
+from pathlib import Path
 
 
 def get_data(tickers, start_date, end_date):
+    # the shared price cache lives at the repo root, one level up
+    root = str(Path(__file__).resolve().parents[1])
+    if root not in sys.path:
+        sys.path.append(root)
     try:
-        data = yf.download(tickers, start=start_date, end=end_date)
+        from price_cache import download
+    except ImportError as e:
+        warnings.warn(f"price cache unavailable ({e}), downloading uncached")
+        from yfinance import download
+
+    try:
+        data = download(tickers, start=start_date, end=end_date)
         return data["Close"]
     except Exception as e:
         print(f"Error fetching data: {e}")
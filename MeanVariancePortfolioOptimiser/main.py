@@ -25,13 +25,25 @@ def main():
 
     log_returns = cal.calculate_log_returns(stock_data)
     mean_returns = cal.calculate_annualized_mean_returns(log_returns)
-    covariance_matrix = cal.calculate_annualized_covariance(log_returns)
+    if args.covariance == "ledoit_wolf":
+        covariance_matrix = cal.calculate_ledoit_wolf_covariance(log_returns)
+    elif args.covariance == "ewma":
+        covariance_matrix = cal.calculate_ewma_covariance(log_returns)
+    elif args.covariance == "factor":
+        covariance_matrix = cal.calculate_factor_covariance(
+            log_returns, args.num_factors
+        )
+    else:
+        covariance_matrix = cal.calculate_annualized_covariance(log_returns)
     optimal_weights = cal.optimize_portfolio(covariance_matrix)
 
     print("\n--- Annualized Mean Returns ---")
     print(mean_returns)
     print("\n--- Annualized Covariance Matrix ---")
-    print(covariance_matrix)
+    if isinstance(covariance_matrix, cal.FactorCovariance):
+        print(covariance_matrix.to_dense())  # only a handful of tickers here
+    else:
+        print(covariance_matrix)
     print("\n--- Portfolio Optimization Results ---")
     print("Optimal Weights:")
     for ticker, weight in zip(stock_tickers, optimal_weights):
@@ -44,6 +56,21 @@ def main():
         f"Expected Annual Volatility: {cal.calculate_portfolio_volatility(optimal_weights, covariance_matrix):.4f}"
     )
 
+    if args.frontier_points > 0:
+        from frontier import efficient_frontier, plot_frontier
+
+        frontier = efficient_frontier(
+            mean_returns.to_numpy(),
+            covariance_matrix,
+            num_points=args.frontier_points,
+            upper=args.max_weight,
+        )
+        print("\n--- Efficient Frontier ---")
+        print(f"{'Return':>8} {'Volatility':>11}")
+        for ret, vol in zip(frontier.returns, frontier.volatilities):
+            print(f"{ret:8.4f} {vol:11.4f}")
+        plot_frontier(frontier, mean_returns, covariance_matrix, stock_tickers)
+
 
 if __name__ == "__main__":
     main()
@@ -1,17 +1,15 @@
 import pandas as pd
 from pathlib import Path
-from pyspedas import get_data, tplot_names
-from pyspedas.projects.omni import data as omni_data
-from pyspedas.projects.kyoto import dst, load_ae
-from pyspedas.projects.noaa import noaa_load_kp
+
+# pyspedas is imported inside the loaders: it is slow to import and only
+# needed when actually fetching data.
 
 TRANGE = ["2009-06-01", "2009-06-15"]
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
-# top-level data directory
+# top-level data directory, created when outputs are written
 DATA_DIR = PROJECT_ROOT / "data"
-DATA_DIR.mkdir(exist_ok=True)
 
 # output files under /data
 OUTFILEMERGED = DATA_DIR / "space_weather_merged.csv"
@@ -19,6 +17,8 @@ OUTFILEALIGNED = DATA_DIR / "space_weather_aligned.csv"
 
 
 def _to_df(varname, colname=None):
+    from pyspedas import get_data
+
     try:
         t, v = get_data(varname)
     except Exception:
@@ -30,6 +30,8 @@ def _to_df(varname, colname=None):
 
 
 def load_omni_data(TRANGE=TRANGE) -> pd.DataFrame:
+    from pyspedas.projects.omni import data as omni_data
+
     omni_data(trange=TRANGE)
     dfs = [
         _to_df("BX_GSE", "BX"),
@@ -47,6 +49,8 @@ def load_omni_data(TRANGE=TRANGE) -> pd.DataFrame:
 
 
 def load_kyoto_data(TRANGE=TRANGE) -> pd.DataFrame:
+    from pyspedas.projects.kyoto import dst, load_ae
+
     dst(trange=TRANGE)
     load_ae(trange=TRANGE)
     df_dst = _to_df("kyoto_dst", "Dst")
@@ -57,6 +61,8 @@ def load_kyoto_data(TRANGE=TRANGE) -> pd.DataFrame:
 
 
 def load_noaa_data(TRANGE=TRANGE) -> pd.DataFrame:
+    from pyspedas.projects.noaa import noaa_load_kp
+
     noaa_load_kp(trange=TRANGE)
     df_kp = _to_df("Kp", "Kp")
 
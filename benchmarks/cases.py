@@ -0,0 +1,384 @@
+"""Benchmark cases for the repo's hot paths.
+
+Each case is registered with ``@benchmark`` and returns a ``(run, units)``
+pair for one point of its parameter sweep: ``run`` is the zero-argument
+callable that gets timed and ``units`` is how much work one call does (paths,
+contracts, samples, ...), used for throughput. Inputs are synthetic so the
+suite runs offline.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# The projects are script folders rather than packages, so expose their modules
+for path in (
+    ROOT,
+    ROOT / "EuropeanOptionPricer" / "src",
+    ROOT / "MeanVariancePortfolioOptimiser",
+    ROOT / "CovarianceMatrixExplorer",
+):
+    if str(path) not in sys.path:
+        sys.path.append(str(path))
+
+BENCHMARKS = {}
+
+
+def benchmark(name, unit, scale, sweep, quick_sweep):
+    """Registers a case; ``sweep``/``quick_sweep`` are lists of param dicts.
+
+    ``scale`` names the swept parameter that scaling curves are reported for.
+    """
+
+    def register(setup):
+        BENCHMARKS[name] = {
+            "setup": setup,
+            "unit": unit,
+            "scale": scale,
+            "sweep": sweep,
+            "quick_sweep": quick_sweep,
+        }
+        return setup
+
+    return register
+
+
+def _synthetic_chain(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return (
+        np.full(n, 100.0),
+        rng.uniform(50, 150, n),
+        rng.choice([1 / 12, 0.25, 0.5, 1.0, 2.0], n),
+        np.full(n, 0.05),
+        rng.uniform(0.05, 0.8, n),
+    )
+
+
+def _synthetic_returns(num_assets, num_observations=756, seed=0):
+    """(observations, assets) simulated daily returns with a market factor."""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0.0004, 0.01, (num_observations, 1))
+    betas = rng.uniform(0.5, 1.5, num_assets)
+    return market * betas + rng.normal(0, 0.015, (num_observations, num_assets))
+
+
+def _synthetic_covariance(num_assets, num_observations=756, seed=0):
+    """Annualized covariance of simulated daily returns with a market factor."""
+    returns = _synthetic_returns(num_assets, num_observations, seed)
+    return np.cov(returns, rowvar=False) * 252
+
+
+def _synthetic_prices(num_dates, num_tickers, seed=0):
+    """(dates, tickers) GBM-like daily closes."""
+    rng = np.random.default_rng(seed)
+    log_returns = rng.normal(0.0003, 0.02, (num_dates, num_tickers))
+    return 100 * np.exp(np.cumsum(log_returns, axis=0))
+
+
+@benchmark(
+    "pricer.bsm_chain",
+    unit="contracts",
+    scale="num_contracts",
+    sweep=[{"num_contracts": n} for n in (10**3, 10**4, 10**5, 10**6)],
+    quick_sweep=[{"num_contracts": n} for n in (10**3, 10**5)],
+)
+def bsm_chain(num_contracts):
+    from model import price_option_chain
+
+    chain = _synthetic_chain(num_contracts)
+    return lambda: price_option_chain(*chain), num_contracts
+
+
+@benchmark(
+    "pricer.monte_carlo",
+    unit="paths",
+    scale="num_simulations",
+    sweep=[{"num_simulations": n} for n in (10**4, 10**5, 10**6, 10**7)],
+    quick_sweep=[{"num_simulations": n} for n in (10**4, 10**6)],
+)
+def pricer_monte_carlo(num_simulations):
+    from model import EuropeanOptionPricerModel
+
+    model = EuropeanOptionPricerModel(100.0, 105.0, 1.0, 0.05, 0.2)
+    return (
+        lambda: model.monte_carlo_estimate("call", num_simulations, seed=0),
+        num_simulations,
+    )
+
+
+@benchmark(
+    "pricer.implied_vol",
+    unit="quotes",
+    scale="num_quotes",
+    sweep=[{"num_quotes": n} for n in (10**3, 10**4, 10**5, 10**6)],
+    quick_sweep=[{"num_quotes": n} for n in (10**3, 10**5)],
+)
+def implied_vol(num_quotes):
+    from implied_vol import implied_volatility
+    from model import price_option_chain
+
+    chain = _synthetic_chain(num_quotes)
+    calls, _ = price_option_chain(*chain)
+    spot, strike, maturity, rate, _ = chain
+    return (
+        lambda: implied_volatility(calls, spot, strike, maturity, rate, "call"),
+        num_quotes,
+    )
+
+
+@benchmark(
+    "simulator.gbm_paths.paths",
+    unit="path-steps",
+    scale="n_paths",
+    sweep=[{"n_paths": n, "n_steps": 252} for n in (100, 1_000, 10_000, 50_000)],
+    quick_sweep=[{"n_paths": n, "n_steps": 252} for n in (100, 5_000)],
+)
+def gbm_paths_by_paths(n_paths, n_steps):
+    import brownian_motion
+
+    return (
+        lambda: brownian_motion.gbm_paths(105, 0.2, 0.05, 1, n_steps, n_paths),
+        n_paths * n_steps,
+    )
+
+
+@benchmark(
+    "simulator.gbm_paths.steps",
+    unit="path-steps",
+    scale="n_steps",
+    sweep=[{"n_paths": 1_000, "n_steps": n} for n in (52, 252, 2_520, 10_000)],
+    quick_sweep=[{"n_paths": 1_000, "n_steps": n} for n in (52, 2_520)],
+)
+def gbm_paths_by_steps(n_paths, n_steps):
+    import brownian_motion
+
+    return (
+        lambda: brownian_motion.gbm_paths(105, 0.2, 0.05, 1, n_steps, n_paths),
+        n_paths * n_steps,
+    )
+
+
+@benchmark(
+    "monte_carlo.pi",
+    unit="samples",
+    scale="num_samples",
+    sweep=[{"num_samples": n} for n in (10**4, 10**5, 10**6, 10**7)],
+    quick_sweep=[{"num_samples": n} for n in (10**4, 10**6)],
+)
+def monte_carlo_pi(num_samples):
+    import monte_carlo
+
+    return lambda: monte_carlo.monte_carlo_pi([num_samples]), num_samples
+
+
+@benchmark(
+    "timeseries.panel_metrics",
+    unit="tickers",
+    scale="num_tickers",
+    sweep=[{"num_tickers": n} for n in (100, 1_000, 3_000, 10_000)],
+    quick_sweep=[{"num_tickers": n} for n in (100, 3_000)],
+)
+def panel_metrics(num_tickers, num_dates=756):
+    import financial_time_series
+
+    prices = _synthetic_prices(num_dates, num_tickers)
+    return lambda: financial_time_series.panel_metrics(prices), num_tickers
+
+
+@benchmark(
+    "timeseries.per_series_loop",
+    unit="tickers",
+    scale="num_tickers",
+    sweep=[{"num_tickers": n} for n in (10, 100, 1_000)],
+    quick_sweep=[{"num_tickers": n} for n in (10, 100)],
+)
+def per_series_loop(num_tickers, num_dates=756):
+    """Baseline for timeseries.panel_metrics: the single-ticker functions."""
+    import pandas as pd
+
+    import financial_time_series as fts
+
+    prices = _synthetic_prices(num_dates, num_tickers)
+    frames = [
+        pd.DataFrame({"Close": prices[:, i], "Adj Close": prices[:, i]})
+        for i in range(num_tickers)
+    ]
+
+    def run():
+        for frame in frames:
+            returns = fts.daily_returns(frame)
+            fts.moving_avgs(frame)
+            fts.ratios(returns["simple_return"])
+
+    return run, num_tickers
+
+
+@benchmark(
+    "timeseries.fill_gaps",
+    unit="tickers",
+    scale="num_tickers",
+    sweep=[{"num_tickers": n} for n in (100, 1_000, 3_000)],
+    quick_sweep=[{"num_tickers": n} for n in (100, 1_000)],
+)
+def fill_gaps(num_tickers, num_dates=756):
+    import pandas as pd
+
+    import financial_time_series
+    from trading_calendar import trading_index
+
+    sessions = trading_index("2020-01-01", "2025-01-01")[:num_dates]
+    prices = pd.DataFrame(_synthetic_prices(num_dates, num_tickers), index=sessions)
+    # knock out ~5% of cells, as if the source skipped them
+    gaps = np.random.default_rng(0).random(prices.shape) < 0.05
+    prices = prices.mask(gaps)
+    return lambda: financial_time_series.fill_gaps(prices, sessions), num_tickers
+
+
+@benchmark(
+    "timeseries.rolling_ratios",
+    unit="ticker-days",
+    scale="num_dates",
+    sweep=[{"num_dates": n} for n in (1_260, 2_520, 5_040, 10_080)],
+    quick_sweep=[{"num_dates": n} for n in (1_260, 5_040)],
+)
+def rolling_ratios(num_dates, num_tickers=20, window=252):
+    import financial_time_series
+
+    prices = _synthetic_prices(num_dates + 1, num_tickers)
+    returns = prices[1:] / prices[:-1] - 1
+    return (
+        lambda: financial_time_series.rolling_ratios(returns, windows=(window,)),
+        num_dates * num_tickers,
+    )
+
+
+@benchmark(
+    "timeseries.rolling_apply",
+    unit="ticker-days",
+    scale="num_dates",
+    sweep=[{"num_dates": n} for n in (1_260, 2_520)],
+    quick_sweep=[{"num_dates": n} for n in (1_260,)],
+)
+def rolling_apply(num_dates, num_tickers=20, window=252):
+    """Baseline for timeseries.rolling_ratios: O(n*w) .rolling().apply."""
+    import pandas as pd
+
+    prices = _synthetic_prices(num_dates + 1, num_tickers)
+    returns = pd.DataFrame(prices[1:] / prices[:-1] - 1)
+
+    def sharpe(x):
+        return (x.mean() - 0.2 / 252) / x.std(ddof=1) * np.sqrt(252)
+
+    def sortino(x):
+        return (x.mean() - 0.2 / 252) / x[x < 0].std(ddof=1) * np.sqrt(252)
+
+    def max_drawdown(x):
+        wealth = np.cumprod(1 + x)
+        return (wealth / np.maximum.accumulate(wealth) - 1).min()
+
+    def run():
+        rolling = returns.rolling(window)
+        for metric in (sharpe, sortino, max_drawdown):
+            rolling.apply(metric, raw=True)
+
+    return run, num_dates * num_tickers
+
+
+@benchmark(
+    "covariance.correlated_gbm",
+    unit="asset-paths",
+    scale="num_assets",
+    sweep=[{"num_assets": n} for n in (7, 50, 200, 500)],
+    quick_sweep=[{"num_assets": n} for n in (7, 200)],
+)
+def correlated_gbm(num_assets, n_paths=10_000, n_steps=12):
+    from src.multi_asset import correlated_gbm_batches, covariance_factor
+
+    cov = _synthetic_covariance(num_assets)
+    factor = covariance_factor(cov)  # factorised once, outside the timed call
+    s_0 = np.full(num_assets, 100.0)
+
+    def run():
+        batches = correlated_gbm_batches(
+            s_0, 0.05, cov, 1.0, n_steps, n_paths, factor=factor
+        )
+        for S in batches:
+            pass
+
+    return run, n_paths * num_assets
+
+
+@benchmark(
+    "optimiser.optimize_portfolio",
+    unit="solves",
+    scale="num_assets",
+    sweep=[{"num_assets": n} for n in (5, 10, 25, 50, 100, 250)],
+    quick_sweep=[{"num_assets": n} for n in (5, 25)],
+)
+def optimize_portfolio(num_assets):
+    """The SciPy SLSQP path (finite-difference gradients)."""
+    import calculations
+
+    sigma = _synthetic_covariance(num_assets)
+    return lambda: calculations.optimize_portfolio(sigma, method="slsqp"), 1
+
+
+@benchmark(
+    "optimiser.projected_gradient",
+    unit="solves",
+    scale="num_assets",
+    sweep=[{"num_assets": n} for n in (5, 25, 100, 250, 500, 1_000, 2_000)],
+    quick_sweep=[{"num_assets": n} for n in (5, 25, 500)],
+)
+def projected_gradient(num_assets):
+    import calculations
+
+    sigma = _synthetic_covariance(num_assets)
+    return (
+        lambda: calculations.optimize_portfolio(sigma, method="projected_gradient"),
+        1,
+    )
+
+
+@benchmark(
+    "optimiser.efficient_frontier",
+    unit="portfolios",
+    scale="num_assets",
+    sweep=[{"num_assets": n} for n in (10, 50, 100, 250)],
+    quick_sweep=[{"num_assets": n} for n in (10, 50)],
+)
+def efficient_frontier(num_assets, num_points=100):
+    """Long-only frontier in one process, warm-started point to point."""
+    import frontier
+
+    sigma = _synthetic_covariance(num_assets)
+    mu = np.random.default_rng(1).uniform(0.02, 0.3, num_assets)
+    return (
+        lambda: frontier.efficient_frontier(mu, sigma, num_points, num_workers=1),
+        num_points,
+    )
+
+
+@benchmark(
+    "optimiser.factor_covariance",
+    unit="solves",
+    scale="num_assets",
+    sweep=[{"num_assets": n} for n in (100, 500, 1_000, 2_000, 5_000)],
+    quick_sweep=[{"num_assets": n} for n in (100, 1_000)],
+)
+def factor_covariance(num_assets, num_factors=5):
+    """PCA factor estimate plus a min-variance solve, O(n k) per matvec."""
+    import pandas as pd
+
+    import calculations
+
+    returns = pd.DataFrame(_synthetic_returns(num_assets))
+
+    def run():
+        sigma = calculations.calculate_factor_covariance(returns, num_factors)
+        calculations.optimize_portfolio(sigma)
+
+    return run, 1
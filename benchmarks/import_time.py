@@ -0,0 +1,117 @@
+"""Import-time budget check for every entry point.
+
+Usage:
+    python benchmarks/import_time.py [--repeat 3] [--scale 1.0]
+
+Each entry point is imported in a fresh interpreter from its own folder (the
+way the scripts are run). The check fails if the import takes longer than its
+budget, or if it pulls in a heavy dependency that should only load on use
+(plotting, downloads, SciPy). Exits non-zero on any failure so it can gate CI.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# (folder, module, budget in seconds, modules that must not be imported)
+ENTRY_POINTS = [
+    (".", "brownian_motion", 0.3, ["matplotlib"]),
+    (".", "monte_carlo", 0.3, ["matplotlib"]),
+    (".", "financial_time_series", 0.6, ["yfinance", "scipy"]),
+    ("EuropeanOptionPricer/src", "main", 0.3, ["scipy"]),
+    ("EuropeanOptionPricer/src", "server", 0.3, ["scipy"]),
+    ("MeanVariancePortfolioOptimiser", "main", 0.3, ["yfinance", "scipy"]),
+    ("CovarianceMatrixExplorer", "main", 0.6, ["matplotlib", "seaborn"]),
+    ("SpaceWeatherVolatility", "main", 0.6, ["pyspedas"]),
+    ("SpaceWeatherVolatility/src", "dataloader", 0.6, ["pyspedas"]),
+    ("BacktestStrategy", "DataHandler", 0.6, ["yfinance"]),
+    ("BookieArbitrage", "main", 0.3, ["matplotlib", "seaborn", "plotly"]),
+    (".", "scenario_store", 0.3, ["matplotlib"]),
+    (".", "path_dependent", 0.3, ["matplotlib"]),
+    (".", "mc_integration", 0.3, ["matplotlib"]),
+    (".", "live_metrics", 0.3, ["pandas"]),
+    (".", "trading_calendar", 0.6, []),
+    (".", "price_cache", 0.6, ["yfinance"]),
+    ("EuropeanOptionPricer/src", "benchmark", 0.3, ["scipy"]),
+    ("EuropeanOptionPricer/src", "loadgen", 0.3, ["scipy"]),
+]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def parse_args():
+    """Parse command line arguments for the import-time check."""
+    parser = argparse.ArgumentParser(description="Check entry point import times.")
+    parser.add_argument(
+        "--repeat",
+        help="fresh interpreters per entry point (the fastest is kept)",
+        type=int,
+        default=3,
+    )
+    parser.add_argument(
+        "--scale",
+        help="multiply every budget, e.g. on slow CI machines",
+        type=float,
+        default=1.0,
+    )
+
+    return parser.parse_args()
+
+
+def probe_import(folder, module):
+    """Imports ``module`` in a new interpreter; returns (seconds, loaded modules)."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module)],
+        cwd=ROOT / folder,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+    return probe["seconds"], probe["modules"]
+
+
+def main():
+    args = parse_args()
+    failures = 0
+    print(f"{'entry point':<45} {'import':>9} {'budget':>8}  status")
+    for folder, module, budget, forbidden in ENTRY_POINTS:
+        label = f"{folder}/{module}.py".removeprefix("./")
+        try:
+            runs = [probe_import(folder, module) for _ in range(args.repeat)]
+        except subprocess.CalledProcessError as e:
+            failures += 1
+            error = e.stderr.strip().splitlines()[-1] if e.stderr else e
+            print(f"{label:<45} {'-':>9} {'-':>8}  FAILED to import: {error}")
+            continue
+
+        seconds = min(run[0] for run in runs)
+        loaded = {name.split(".")[0] for name in runs[0][1]}
+        eager = sorted(set(forbidden) & loaded)
+        over_budget = seconds > budget * args.scale
+
+        status = "ok"
+        if over_budget:
+            status = "OVER BUDGET"
+        if eager:
+            status += f" (eagerly imports {', '.join(eager)})"
+        if over_budget or eager:
+            failures += 1
+        print(f"{label:<45} {seconds:>8.3f}s {budget * args.scale:>7.2f}s  {status}")
+
+    print(f"\n{failures} failure(s)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
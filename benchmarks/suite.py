@@ -0,0 +1,201 @@
+"""Offline performance benchmark suite.
+
+Usage:
+    python benchmarks/suite.py run [--quick] [--filter PREFIX] [--output FILE]
+    python benchmarks/suite.py compare BASELINE.json CANDIDATE.json [--threshold 0.1]
+
+``run`` times every registered case over its parameter sweep and reports
+throughput, peak traced memory and the log-log scaling slope of each case.
+``compare`` matches two result files case by case and exits non-zero if any
+case got slower, or used more peak memory, by more than the threshold.
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from cases import BENCHMARKS
+
+
+def parse_args():
+    """Parse command line arguments for the benchmark suite."""
+    parser = argparse.ArgumentParser(description="Run or compare benchmarks.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="run the benchmark suite")
+    run.add_argument(
+        "--quick", help="use the smaller parameter sweeps", action="store_true"
+    )
+    run.add_argument(
+        "--filter",
+        help="only run cases whose name starts with this prefix",
+        type=str,
+        default="",
+    )
+    run.add_argument(
+        "--repeat",
+        help="timed repetitions per point (the best is kept)",
+        type=int,
+        default=3,
+    )
+    run.add_argument(
+        "--output", help="write results to this JSON file", type=str, default=None
+    )
+
+    compare = subparsers.add_parser("compare", help="compare two result files")
+    compare.add_argument("baseline", help="results JSON of the reference run")
+    compare.add_argument("candidate", help="results JSON of the run to check")
+    compare.add_argument(
+        "--threshold",
+        help="relative slowdown that counts as a regression",
+        type=float,
+        default=0.10,
+    )
+
+    return parser.parse_args()
+
+
+def measure(run, repeat):
+    """Best-of-``repeat`` wall time, then one traced call for peak memory."""
+    run()  # warm-up: imports, caches, first-touch page faults
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def scaling_slope(points, scale):
+    """Log-log slope of seconds against the swept parameter (1.0 is linear)."""
+    sizes = np.array([point["params"][scale] for point in points], dtype=float)
+    seconds = np.array([point["seconds"] for point in points])
+    if len(points) < 2 or np.ptp(np.log(sizes)) == 0:
+        return None
+    return float(np.polyfit(np.log(sizes), np.log(seconds), 1)[0])
+
+
+def run_suite(args):
+    results = {}
+    for name, case in BENCHMARKS.items():
+        if not name.startswith(args.filter):
+            continue
+        print(f"\n--- {name} ({case['unit']}) ---")
+        points = []
+        sweep = case["quick_sweep"] if args.quick else case["sweep"]
+        for params in sweep:
+            try:
+                run, units = case["setup"](**params)
+                seconds, peak = measure(run, args.repeat)
+            except ImportError as e:
+                print(f"skipped: {e}")
+                break
+            point = {
+                "params": params,
+                "units": units,
+                "seconds": seconds,
+                "throughput": units / seconds,
+                "peak_mb": peak / 2**20,
+            }
+            points.append(point)
+            print(
+                f"{json.dumps(params):<40} {seconds:>10.4f}s "
+                f"{point['throughput']:>14,.0f} {case['unit']}/s "
+                f"{point['peak_mb']:>10.1f} MB peak"
+            )
+        if points:
+            slope = scaling_slope(points, case["scale"])
+            if slope is not None:
+                print(f"scaling exponent in {case['scale']}: {slope:.2f}")
+            results[name] = {
+                "unit": case["unit"],
+                "scale": case["scale"],
+                "points": points,
+                "scaling_exponent": slope,
+            }
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved results to {args.output}")
+    return report
+
+
+def compare_results(args):
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    with open(args.candidate) as f:
+        candidate = json.load(f)["results"]
+
+    regressions = 0
+    print(f"{'case':<32} {'params':<40} {'base':>10} {'new':>10} {'change':>8}")
+    for name, case in candidate.items():
+        if name not in baseline:
+            continue
+        base_points = {
+            json.dumps(point["params"], sort_keys=True): point
+            for point in baseline[name]["points"]
+        }
+        for point in case["points"]:
+            key = json.dumps(point["params"], sort_keys=True)
+            if key not in base_points:
+                continue
+            base_seconds = base_points[key]["seconds"]
+            change = point["seconds"] / base_seconds - 1
+            # Ignore memory noise below 1 MB so tiny cases don't flap
+            memory_growth = point["peak_mb"] - base_points[key]["peak_mb"]
+            memory_regressed = memory_growth > max(
+                1.0, args.threshold * base_points[key]["peak_mb"]
+            )
+            flag = ""
+            if change > args.threshold:
+                flag = "REGRESSION"
+            elif change < -args.threshold:
+                flag = "faster"
+            if memory_regressed:
+                flag += f" MEMORY +{memory_growth:.1f} MB"
+            if change > args.threshold or memory_regressed:
+                regressions += 1
+            print(
+                f"{name:<32} {key:<40} {base_seconds:>9.4f}s "
+                f"{point['seconds']:>9.4f}s {change:>+7.1%} {flag}"
+            )
+
+    print(f"\n{regressions} regression(s) beyond {args.threshold:.0%}")
+    return regressions
+
+
+def main():
+    args = parse_args()
+    if args.command == "run":
+        run_suite(args)
+    elif compare_results(args):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
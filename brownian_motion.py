@@ -1,10 +1,13 @@
+from typing import NamedTuple
+
 import numpy as np
-import matplotlib.pyplot as plt
 
 rng = np.random.default_rng()
+_module_rng = rng  # functions below take an optional rng that shadows this
 
 
-def gbm_paths(s_0, sigma, r, T, n_steps, n_paths):
+def gbm_paths(s_0, sigma, r, T, n_steps, n_paths, rng=None):
+    rng = _module_rng if rng is None else rng
     dt = T / n_steps
     dW = rng.normal(0, np.sqrt(dt), size=(n_paths, n_steps))
     W = np.cumsum(dW, axis=1)
@@ -13,9 +16,128 @@ def gbm_paths(s_0, sigma, r, T, n_steps, n_paths):
     return t, S  # shape (paths, steps)
 
 
+def gbm_path_blocks(
+    s_0, sigma, r, T, n_steps, n_paths, block_paths=1000, dtype=np.float64, rng=None
+):
+    # Same paths as gbm_paths, but yielded block_paths rows at a time so only
+    # one (block_paths, n_steps) array is alive. With float64 and the same rng
+    # state the rows are identical to gbm_paths, since the normals are drawn in
+    # the same order.
+    rng = _module_rng if rng is None else rng
+    dt = T / n_steps
+    drift = ((r - 0.5 * sigma**2) * np.linspace(0, T, n_steps)).astype(dtype)
+    for start in range(0, n_paths, block_paths):
+        n = min(block_paths, n_paths - start)
+        S = rng.standard_normal((n, n_steps), dtype=dtype)
+        S *= np.sqrt(dt)
+        # cumsum and exp in place: dW -> W -> log(S / s_0) -> S
+        np.cumsum(S, axis=1, out=S)
+        S *= sigma
+        S += drift
+        np.exp(S, out=S)
+        S *= s_0
+        yield S
+
+
+def gbm_time_blocks(
+    s_0, sigma, r, T, n_steps, n_paths, block_steps=100, dtype=np.float64, rng=None
+):
+    # Walks all paths forward block_steps columns at a time, carrying W across
+    # blocks. Yields (first_step, S_block) with S_block of shape
+    # (n_paths, block_steps), so memory is n_paths * block_steps.
+    rng = _module_rng if rng is None else rng
+    dt = T / n_steps
+    t = np.linspace(0, T, n_steps)
+    W = np.zeros((n_paths, 1), dtype=dtype)
+    for start in range(0, n_steps, block_steps):
+        n = min(block_steps, n_steps - start)
+        S = rng.standard_normal((n_paths, n), dtype=dtype)
+        S *= np.sqrt(dt)
+        S[:, :1] += W
+        np.cumsum(S, axis=1, out=S)
+        W = S[:, -1:].copy()
+        S *= sigma
+        S += ((r - 0.5 * sigma**2) * t[start : start + n]).astype(dtype)
+        np.exp(S, out=S)
+        S *= s_0
+        yield start, S
+
+
+class PathStatistics(NamedTuple):
+    t: np.ndarray
+    mean_path: np.ndarray
+    std_path: np.ndarray
+    terminal: np.ndarray  # S_T of every path, shape (n_paths,)
+    sample_paths: np.ndarray  # first few full paths, kept for plotting
+    n_paths: int
+
+
+def running_path_statistics(blocks, T, n_keep=20):
+    # Welford-style per-time-step mean/variance over an iterable of path
+    # blocks (each (paths, steps)), merging block moments with Chan's update.
+    # Only the moments, S_T and n_keep sample paths are kept in memory.
+    count = 0
+    mean = None
+    m2 = None
+    terminal = []
+    samples = []
+    kept = 0
+    for S in blocks:
+        n = S.shape[0]
+        block_mean = S.mean(axis=0, dtype=np.float64)
+        block_m2 = ((S - block_mean) ** 2).sum(axis=0)
+        if mean is None:
+            mean, m2 = block_mean, block_m2
+        else:
+            delta = block_mean - mean
+            total = count + n
+            mean = mean + delta * n / total
+            m2 = m2 + block_m2 + delta**2 * count * n / total
+        count += n
+
+        terminal.append(np.array(S[:, -1], dtype=np.float64))
+        if kept < n_keep:
+            samples.append(np.array(S[: n_keep - kept]))
+            kept += len(samples[-1])
+
+    n_steps = len(mean)
+    return PathStatistics(
+        t=np.linspace(0, T, n_steps),
+        mean_path=mean,
+        std_path=np.sqrt(m2 / count),  # population std, like S.std(axis=0)
+        terminal=np.concatenate(terminal),
+        sample_paths=np.concatenate(samples),
+        n_paths=count,
+    )
+
+
+def gbm_statistics(
+    s_0,
+    sigma,
+    r,
+    T,
+    n_steps,
+    n_paths,
+    block_paths=1000,
+    dtype=np.float64,
+    n_keep=20,
+    rng=None,
+):
+    # Bounded-memory replacement for gbm_paths when only the mean/std path and
+    # terminal prices are needed: peak memory is one path block plus O(n_paths)
+    blocks = gbm_path_blocks(
+        s_0, sigma, r, T, n_steps, n_paths, block_paths, dtype=dtype, rng=rng
+    )
+    return running_path_statistics(blocks, T, n_keep=n_keep)
+
+
 def euro_call_price(stock_data, K, r, T):
     # want the data for today so must apply disc factor
-    S_T = stock_data[:, -1]  # grab last price from every path at t=T
+    # stock_data is either the full path matrix or just the terminal prices
+    if stock_data.ndim == 2:
+        S_T = stock_data[:, -1]  # grab last price from every path at t=T
+    else:
+        S_T = stock_data
     payoffs = np.maximum(S_T - K, 0)
     discounted_payoffs = np.exp(-r * T) * payoffs  # discount back to t=0
     price = np.mean(discounted_payoffs)  # Monte Carlo expected value
@@ -23,11 +145,20 @@ def euro_call_price(stock_data, K, r, T):
 
 
 def plot_mean_vs_analytical(T, S, s0, r, n_show=20):
-    n_paths, n_steps = S.shape
-    t = np.linspace(0, T, n_steps)
+    import matplotlib.pyplot as plt
+
+    # S is either the full path matrix or a PathStatistics from gbm_statistics
+    if isinstance(S, PathStatistics):
+        stats = S
+        S = stats.sample_paths
+        n_paths = stats.n_paths
+        t, mean_path = stats.t, stats.mean_path
+    else:
+        n_paths, n_steps = S.shape
+        t = np.linspace(0, T, n_steps)
+        mean_path = S.mean(axis=0)
+    n_show = min(n_show, len(S))
 
-    mean_path = S.mean(axis=0)
-    std_path = S.std(axis=0)
     analytical_st = s0 * np.exp(r * t)
 
     # Error between analytical and Monte Carlo mean
@@ -37,13 +168,19 @@ def plot_mean_vs_analytical(T, S, s0, r, n_show=20):
         3, 1, figsize=(10, 10), sharex=True, gridspec_kw={"height_ratios": [2, 1, 0.8]}
     )
 
-    for i in range(min(n_show, n_paths)):
+    for i in range(n_show):
         axes[0].plot(t, S[i], lw=0.8, alpha=0.6)
     axes[0].set_title(f"{n_show} Random GBM Paths")
     axes[0].set_ylabel("Stock Price $S_t$")
     axes[0].grid(alpha=0.3)
 
-    axes[1].plot(t, mean_path, color="black", lw=2, label="Monte Carlo Mean Path")
+    axes[1].plot(
+        t,
+        mean_path,
+        color="black",
+        lw=2,
+        label=f"Monte Carlo Mean Path ({n_paths:,} paths)",
+    )
     axes[1].plot(t, analytical_st, "r--", lw=2, label="Analytical $E[S_t]=S_0 e^{rt}$")
 
     axes[1].set_title("Monte Carlo Mean vs Analytical Expectation")
@@ -70,17 +207,18 @@ def plot_mean_vs_analytical(T, S, s0, r, n_show=20):
 def main():
     n_steps, n_paths = 10000, 10000
     r, T, s0, sigma, K = 0.05, 1, 105, 0.2, 100
-    t, S = gbm_paths(s0, sigma, r, T, n_steps, n_paths)
-    plot_mean_vs_analytical(T, S, s0, r)
+    # stream the paths in blocks rather than holding the full 10k x 10k matrix
+    stats = gbm_statistics(s0, sigma, r, T, n_steps, n_paths, block_paths=500)
+    plot_mean_vs_analytical(T, stats, s0, r)
 
-    mean_path = S.mean(axis=0)
+    mean_path = stats.mean_path
 
-    call_price = euro_call_price(S, K, r, T)
+    call_price = euro_call_price(stats.terminal, K, r, T)
     print("Monte Carlo Call Price =", call_price)
     print(
         "Analytical vs Monte Carlo Stock Price:", mean_path[-1], s0 * np.exp(r * T)
     )  # should be close to s0*exp(r*T)
-    S_T = S[:, -1]
+    S_T = stats.terminal
     mc_E_X2 = np.mean(S_T**2)
     theory_E_X2 = s0**2 * np.exp(2 * r * T + sigma**2 * T)
     print("Monte Carlo E[X^2] =", mc_E_X2)
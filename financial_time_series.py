@@ -7,9 +7,12 @@
 # Stretch: Automatically handle missing dates (reindexing + interpolation).
 # Libraries: pandas, numpy
 
+from typing import NamedTuple
+
 import numpy as np
 import pandas as pd
-import yfinance as yf
+
+from trading_calendar import trading_index
 
 
 def daily_returns(data):
@@ -64,38 +67,371 @@ def ratios(data, risk_free_rate=0.2):
     return sharpe, sortino, max_drawdown
 
 
-def get_data(tickers, start_date, end_date):
+# Panel mode: the same metrics for a whole universe at once. Prices are a 2-D
+# (dates, tickers) array and every metric is one vectorised pass along the
+# date axis, instead of looping the per-series functions above per ticker.
+
+
+class PanelMetrics(NamedTuple):
+    simple_returns: np.ndarray  # (dates - 1, tickers)
+    log_returns: np.ndarray
+    sma: np.ndarray  # (dates, tickers), NaN until a full window
+    ema: np.ndarray
+    sharpe: np.ndarray  # (tickers,)
+    sortino: np.ndarray
+    max_drawdown: np.ndarray
+
+
+def panel_returns(prices):
+    prices = np.asarray(prices, dtype=float)
+    simple = prices[1:] / prices[:-1] - 1
+    log = np.log(prices[1:] / prices[:-1])
+    return simple, log
+
+
+def panel_sma(prices, window=20):
+    # rolling mean from a cumulative sum; any NaN in the window gives NaN,
+    # like close.rolling(window).mean()
+    prices = np.asarray(prices, dtype=float)
+    missing = np.isnan(prices)
+    csum = np.cumsum(np.where(missing, 0.0, prices), axis=0)
+    cmiss = np.cumsum(missing, axis=0)
+    sma = np.full(prices.shape, np.nan)
+    if len(prices) < window:
+        return sma
+    window_sum = csum[window - 1 :].copy()
+    window_sum[1:] -= csum[:-window]
+    window_miss = cmiss[window - 1 :].copy()
+    window_miss[1:] -= cmiss[:-window]
+    sma[window - 1 :] = np.where(window_miss == 0, window_sum / window, np.nan)
+    return sma
+
+
+def panel_ema(prices, window=20):
+    # ewm(span=window, adjust=False) column by column, with pandas' default
+    # ignore_na=False: a loop over dates, vectorised over tickers. Each ticker
+    # starts at its first valid price. Through a gap the EMA holds its value
+    # but its weight keeps decaying, so the next price counts for more.
+    prices = np.asarray(prices, dtype=float)
+    alpha = 2 / (window + 1)
+    ema = np.empty_like(prices)
+    current = np.full(prices.shape[1:], np.nan)
+    old_weight = np.ones(prices.shape[1:])
+    for i, row in enumerate(prices):
+        started = ~np.isnan(current)
+        observed = ~np.isnan(row)
+        old_weight = np.where(started, old_weight * (1 - alpha), old_weight)
+        blended = (old_weight * current + alpha * row) / (old_weight + alpha)
+        current = np.where(started, np.where(observed, blended, current), row)
+        old_weight = np.where(observed, 1.0, old_weight)
+        ema[i] = current
+    return ema
+
+
+def panel_ratios(returns, risk_free_rate=0.2):
+    # sharpe, sortino and max drawdown per column; NaNs are skipped like the
+    # dropna() in ratios
+    returns = np.asarray(returns, dtype=float)
+    excess = np.nanmean(returns, axis=0) - risk_free_rate / 252
+    sharpe = excess / np.nanstd(returns, axis=0, ddof=1) * np.sqrt(252)
+    downside = np.where(returns < 0, returns, np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sortino = excess / np.nanstd(downside, axis=0, ddof=1) * np.sqrt(252)
+
+    # wealth is undefined before a ticker's first return, so its peak starts
+    # at the first real wealth, as in ratios() on the dropna()'d column
+    cumulative = np.cumprod(1 + np.nan_to_num(returns), axis=0)
+    started = np.logical_or.accumulate(~np.isnan(returns), axis=0)
+    cumulative = np.where(started, cumulative, np.nan)
+    running_max = np.fmax.accumulate(cumulative, axis=0)
+    drawdown = (cumulative - running_max) / running_max
+    max_drawdown = np.fmin.reduce(drawdown, axis=0)
+    return sharpe, sortino, max_drawdown
+
+
+def panel_metrics(prices, window=20, risk_free_rate=0.2):
+    # prices is a (dates, tickers) array or DataFrame, e.g. from get_panel_data
+    prices = np.asarray(prices, dtype=float)
+    simple, log = panel_returns(prices)
+    sharpe, sortino, max_drawdown = panel_ratios(simple, risk_free_rate)
+    return PanelMetrics(
+        simple_returns=simple,
+        log_returns=log,
+        sma=panel_sma(prices, window),
+        ema=panel_ema(prices, window),
+        sharpe=sharpe,
+        sortino=sortino,
+        max_drawdown=max_drawdown,
+    )
+
+
+# Rolling versions of ratios(): every window is exactly what ratios() would give
+# for that slice of returns, but computed in O(n) per column instead of O(n*w).
+# Inputs are (dates,) or (dates, tickers) arrays/DataFrames; the first
+# window - 1 rows, and any window containing a NaN, come out as NaN.
+
+
+def _window_sums(values, window):
+    # sum over each trailing window from a cumulative sum, rows window-1 on
+    csum = np.cumsum(values, axis=0)
+    sums = csum[window - 1 :].copy()
+    sums[1:] -= csum[:-window]
+    return sums
+
+
+def _rolling_output(result, returns, window):
+    # pad the first window - 1 rows with NaN, mask windows with NaNs, and
+    # hand back a DataFrame/Series if that is what came in
+    values = np.asarray(returns, dtype=float)
+    out = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        has_nan = _window_sums(np.isnan(values).astype(float), window) > 0
+        out[window - 1 :] = np.where(has_nan, np.nan, result)
+    if isinstance(returns, pd.DataFrame):
+        return pd.DataFrame(out, index=returns.index, columns=returns.columns)
+    if isinstance(returns, pd.Series):
+        return pd.Series(out, index=returns.index, name=returns.name)
+    return out
+
+
+def _rolling_moments(values, window):
+    # count, mean and ddof=1 std per window; values are shifted by their
+    # column mean first so the sum-of-squares difference doesn't cancel
+    count = _window_sums(~np.isnan(values), window)
+    shift = np.nanmean(values, axis=0) if np.any(~np.isnan(values)) else 0.0
+    centred = np.nan_to_num(values - shift)
+    s1 = _window_sums(centred, window)
+    s2 = _window_sums(centred**2, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = s1 / count
+        var = np.where(count > 1, (s2 - s1 * mean) / (count - 1), np.nan)
+    return count, mean + shift, np.sqrt(np.maximum(var, 0.0))
+
+
+def rolling_sharpe(returns, window=252, risk_free_rate=0.2):
+    values = np.asarray(returns, dtype=float)
+    if len(values) < window:
+        return _rolling_output(None, returns, window)
+    _, mean, std = _rolling_moments(values, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sharpe = (mean - risk_free_rate / 252) / std * np.sqrt(252)
+    return _rolling_output(sharpe, returns, window)
+
+
+def rolling_sortino(returns, window=252, risk_free_rate=0.2):
+    # downside deviation = ddof=1 std of the negative returns in the window,
+    # from conditional sums
+    values = np.asarray(returns, dtype=float)
+    if len(values) < window:
+        return _rolling_output(None, returns, window)
+    _, mean, _ = _rolling_moments(values, window)
+    downside = np.where(values < 0, values, np.nan)
+    _, _, downside_std = _rolling_moments(downside, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sortino = (mean - risk_free_rate / 252) / downside_std * np.sqrt(252)
+    return _rolling_output(sortino, returns, window)
+
+
+def _combine_drawdown(a, b):
+    # (max, min, worst drop) of segment a followed by segment b
+    a_max, a_min, a_dd = a
+    b_max, b_min, b_dd = b
+    return (
+        np.maximum(a_max, b_max),
+        np.minimum(a_min, b_min),
+        np.minimum(np.minimum(a_dd, b_dd), b_min - a_max),
+    )
+
+
+def rolling_max_drawdown(returns, window=252):
+    # Max drawdown of (1 + r).cumprod() within each window. On log wealth L
+    # that is min over i <= k of L_k - L_i, and (max, min, worst drop) of a
+    # segment combines associatively, so each window is one suffix aggregate
+    # of its first block plus one prefix aggregate of the next (van Herk /
+    # Gil-Werman). Same O(n) as a monotonic deque on the running peak, but
+    # vectorised across tickers.
+    values = np.asarray(returns, dtype=float)
+    if len(values) < window:
+        return _rolling_output(None, returns, window)
+    n = len(values)
+    log_wealth = np.cumsum(np.log1p(np.nan_to_num(values)), axis=0)
+    # pad to whole blocks with the last value, which adds no new pairs
+    pad = -n % window
+    padded = np.concatenate([log_wealth, np.repeat(log_wealth[-1:], pad, axis=0)])
+    blocks = padded.reshape(-1, window, *values.shape[1:])
+
+    prefix_max = np.maximum.accumulate(blocks, axis=1)
+    prefix_min = np.minimum.accumulate(blocks, axis=1)
+    prefix_dd = np.minimum.accumulate(blocks - prefix_max, axis=1)
+
+    reverse = blocks[:, ::-1]
+    suffix_max = np.maximum.accumulate(reverse, axis=1)[:, ::-1]
+    suffix_min = np.minimum.accumulate(reverse, axis=1)[:, ::-1]
+    suffix_dd = np.minimum.accumulate((suffix_min - blocks)[:, ::-1], axis=1)[:, ::-1]
+
+    def flat(x):
+        return x.reshape(padded.shape)[:n]
+
+    starts = np.arange(n - window + 1)
+    ends = starts + window - 1
+    suffix = tuple(flat(x)[starts] for x in (suffix_max, suffix_min, suffix_dd))
+    prefix = tuple(flat(x)[ends] for x in (prefix_max, prefix_min, prefix_dd))
+    _, _, drop = _combine_drawdown(suffix, prefix)
+    # a window that starts on a block boundary is exactly that block
+    aligned = starts % window == 0
+    drop[aligned] = suffix[2][aligned]
+    return _rolling_output(np.expm1(drop), returns, window)
+
+
+def rolling_ratios(returns, windows=(63, 126, 252), risk_free_rate=0.2):
+    # {window: (sharpe, sortino, max_drawdown)} series for each window length
+    return {
+        window: (
+            rolling_sharpe(returns, window, risk_free_rate),
+            rolling_sortino(returns, window, risk_free_rate),
+            rolling_max_drawdown(returns, window),
+        )
+        for window in windows
+    }
+
+
+def _last_valid_row(valid):
+    # per cell, the row of the latest valid value at or above it (-1 if none)
+    rows = np.arange(len(valid)).reshape(-1, *([1] * (valid.ndim - 1)))
+    return np.maximum.accumulate(np.where(valid, rows, -1), axis=0)
+
+
+def fill_gaps(data, index, ffill_columns=("Volume",)):
+    """Reindexes to a trading calendar and fills the gaps in one 2-D pass.
+
+    Prices are interpolated in time between the surrounding real values
+    (gaps before the first / after the last value are left as NaN), columns
+    named in ``ffill_columns`` (any level) are forward filled. Returns the
+    filled frame and a same-shaped boolean frame flagging synthesised cells.
+    """
+    # compare timestamps in the calendar's terms: intraday calendars are in
+    # exchange time (naive data is taken to be exchange-local), daily
+    # sessions are naive dates, matched on the source's own wall clock
+    if index.tz is not None:
+        if data.index.tz is None:
+            data = data.tz_localize(index.tz)
+        else:
+            data = data.tz_convert(index.tz)
+    elif data.index.tz is not None:
+        data = data.tz_localize(None)
+
+    # rows off the calendar are kept only if the source really has data there
+    extra = data.index.difference(index)
+    extra = extra[data.loc[extra].notna().any(axis=1).to_numpy()]
+    data = data.reindex(index.union(extra))
+    values = data.to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    n = len(values)
+    cols = np.arange(values.shape[1])
+
+    prev_row = _last_valid_row(valid)
+    next_row = n - 1 - _last_valid_row(valid[::-1])[::-1]
+    has_prev = prev_row >= 0
+    has_next = next_row < n
+    prev_row = np.where(has_prev, prev_row, 0)
+    next_row = np.where(has_next, next_row, n - 1)
+
+    # time-weighted linear interpolation, like interpolate(method="time")
+    t = data.index.values.astype("int64").astype(float)[:, None]
+    t_prev, t_next = t[prev_row, 0], t[next_row, 0]
+    v_prev, v_next = values[prev_row, cols], values[next_row, cols]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weight = np.where(t_next > t_prev, (t - t_prev) / (t_next - t_prev), 0.0)
+    interpolated = np.where(
+        has_prev & has_next, v_prev + weight * (v_next - v_prev), np.nan
+    )
+
+    labels = data.columns
+    if isinstance(labels, pd.MultiIndex):
+        is_ffill = np.zeros(len(labels), dtype=bool)
+        for level in range(labels.nlevels):
+            is_ffill |= labels.get_level_values(level).isin(ffill_columns)
+    else:
+        is_ffill = labels.isin(ffill_columns)
+    forward = np.where(has_prev, v_prev, np.nan)
+    filled = np.where(valid, values, np.where(is_ffill, forward, interpolated))
+
+    flags = pd.DataFrame(~valid & ~np.isnan(filled), index=data.index, columns=labels)
+    return pd.DataFrame(filled, index=data.index, columns=labels), flags
+
+
+def get_panel_data(
+    tickers, start_date, end_date, field="Close", exchange="XNYS", return_flags=False
+):
+    # like get_data but keeps the ticker level: returns a (dates, tickers)
+    # frame of one price field
+    from price_cache import download
+
     try:
-        data = yf.download(tickers, start=start_date, end=end_date)
+        data = download(list(tickers), start=start_date, end=end_date)
+        if isinstance(data.columns, pd.MultiIndex):
+            prices = data[field]
+        else:
+            prices = data[[field]].set_axis(list(tickers)[:1], axis=1)
+        sessions = trading_index(prices.index.min(), prices.index.max(), exchange)
+        prices, flags = fill_gaps(prices, sessions)
+        return (prices, flags) if return_flags else prices
+    except Exception as e:
+        print(f"Error fetching data: {e}")
+        return None
+
+
+def get_data(tickers, start_date, end_date, exchange="XNYS", return_flags=False):
+    from price_cache import download
+
+    try:
+        data = download(tickers, start=start_date, end=end_date)
         if isinstance(data.columns, pd.MultiIndex):
             # Flatten MultiIndex columns if multiple tickers
             # i.e. splits multiple tickers into single level columns
             # each then has values
             data.columns = data.columns.get_level_values(0)
 
-        # Reindex to include all business days
-        full_index = pd.date_range(data.index.min(), data.index.max(), freq="B")
-        data = data.reindex(full_index)
-
-        # Interpolate missing values for prices
-        price_cols = ["Open", "High", "Low", "Close", "Adj Close"]
-        for col in price_cols:
-            if col in data.columns:
-                data[col] = data[col].interpolate(
-                    method="time"
-                )  # pandas uses the actual timestamps in your DateTimeIndex to compute the interpolation weights.
-                # it adds data for the reindexed dates using linear interpolation based on time, i.e. half way between two known data points
-        # Forward fill Volume
-        # interpolates using previous value for missing volume data, can be bad for certain metrics, weekend volume and holidays always 0
-        if "Volume" in data.columns:
-            data["Volume"] = data["Volume"].fillna(method="ffill")
-        return data
+        # Reindex to the exchange's trading sessions (not every business day,
+        # which would invent prices on holidays). Prices are interpolated in
+        # time between the known values either side, volume is forward
+        # filled; flags marks every cell that was filled in.
+        sessions = trading_index(data.index.min(), data.index.max(), exchange)
+        data, flags = fill_gaps(data, sessions, ffill_columns=["Volume"])
+        return (data, flags) if return_flags else data
     except Exception as e:
         print(f"Error fetching data: {e}")
         return None
 
 
 def main():
+    # panel vs per-series on tickers that list partway through the panel
+    rng = np.random.default_rng(0)
+    staggered = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0.0, 0.02, (300, 4)), axis=0)),
+        columns=["A", "B", "C", "D"],
+    )
+    staggered.iloc[:1, 1] = np.nan
+    staggered.iloc[:40, 2] = np.nan
+    staggered.iloc[:150, 3] = np.nan
+    staggered.iloc[150:152, 3] = [100, 70]  # opens with a loss
+    panel = panel_metrics(staggered)
+    for i, ticker in enumerate(staggered.columns):
+        column = ratios(staggered[ticker].pct_change())
+        got = (panel.sharpe[i], panel.sortino[i], panel.max_drawdown[i])
+        assert np.allclose(got, column, rtol=1e-9, atol=1e-12), (ticker, got, column)
+
+    # tz-aware intraday bars (yfinance hands them back in UTC or exchange
+    # time) against the exchange's 30-minute bar calendar
+    bars = trading_index("2024-07-03", "2024-07-05", freq="30min")
+    intraday = pd.DataFrame(
+        {"Close": np.arange(len(bars), dtype=float), "Volume": 1.0},
+        index=bars.tz_convert("UTC"),
+    ).drop(bars[[3, 4]].tz_convert("UTC"))
+    filled, flags = fill_gaps(intraday, trading_index(*bars[[0, -1]], freq="30min"))
+    assert filled.index.equals(bars) and flags.to_numpy().sum() == 4
+    assert np.allclose(filled["Close"], np.arange(len(bars)))
+
     data = get_data("AAPL", "2020-07-24", "2023-07-28")
 
     rets = daily_returns(data)
@@ -116,6 +452,22 @@ def main():
     print("Sortino Ratio:", sortino)
     print("Max Drawdown:", max_dd)
 
+    # panel mode: every ticker in one pass, ticker axis kept
+    tickers = ["AAPL", "MSFT", "GOOG", "AMZN"]
+    prices = get_panel_data(tickers, "2020-07-24", "2023-07-28")
+    panel = panel_metrics(prices)
+    print("\nPanel metrics:")
+    print(
+        pd.DataFrame(
+            {
+                "sharpe": panel.sharpe,
+                "sortino": panel.sortino,
+                "max_drawdown": panel.max_drawdown,
+            },
+            index=prices.columns,
+        )
+    )
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,293 @@
+import json
+import math
+
+import numpy as np
+
+# Bar-by-bar versions of the financial_time_series metrics for live use. Each
+# calculator updates in O(1) per observation (the batch functions recompute
+# the whole history), matches the batch result on the same data, and can be
+# checkpointed with to_dict() / from_dict() (plain JSON-able values). NaN
+# inputs are skipped, so the match is with the batch result on the series
+# with its NaNs dropped.
+
+
+class StreamingSMA:
+    """close.rolling(window).mean() over a ring buffer; NaN until full."""
+
+    def __init__(self, window=20):
+        self.window = window
+        self.buffer = np.zeros(window)
+        self.count = 0
+        self.total = 0.0
+
+    def update(self, x):
+        if math.isnan(x):
+            return self.value
+        i = self.count % self.window
+        self.total += x - self.buffer[i]
+        self.buffer[i] = x
+        self.count += 1
+        if i == self.window - 1:
+            # re-sum once per lap so rounding errors can't build up
+            self.total = float(self.buffer.sum())
+        return self.value
+
+    @property
+    def value(self):
+        return self.total / self.window if self.count >= self.window else math.nan
+
+    def to_dict(self):
+        return {
+            "window": self.window,
+            "buffer": self.buffer.tolist(),
+            "count": self.count,
+            "total": self.total,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        sma = cls(state["window"])
+        sma.buffer = np.array(state["buffer"], dtype=float)
+        sma.count = state["count"]
+        sma.total = state["total"]
+        return sma
+
+
+class StreamingEMA:
+    """close.ewm(span=window, adjust=False).mean()."""
+
+    def __init__(self, window=20):
+        self.window = window
+        self.alpha = 2 / (window + 1)
+        self.value = math.nan
+
+    def update(self, x):
+        if math.isnan(x):
+            return self.value
+        if math.isnan(self.value):
+            self.value = x
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+    def to_dict(self):
+        return {"window": self.window, "value": self.value}
+
+    @classmethod
+    def from_dict(cls, state):
+        ema = cls(state["window"])
+        ema.value = state["value"]
+        return ema
+
+
+class _Moments:
+    # Welford's online mean / variance
+
+    def __init__(self, count=0, mean=0.0, m2=0.0):
+        self.count, self.mean, self.m2 = count, mean, m2
+
+    def update(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    @property
+    def std(self):
+        # ddof=1, like pandas .std()
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else math.nan
+
+    def to_dict(self):
+        return {"count": self.count, "mean": self.mean, "m2": self.m2}
+
+
+class StreamingDrawdown:
+    """Max drawdown of (1 + r).cumprod() via the running peak."""
+
+    def __init__(self):
+        self.wealth = 1.0
+        # like cummax(), the peak starts at the first wealth (1 + r_1), not 1
+        self.peak = None
+        self.max_drawdown = 0.0
+
+    def update(self, r):
+        self.wealth *= 1 + r
+        self.peak = self.wealth if self.peak is None else max(self.peak, self.wealth)
+        self.max_drawdown = min(
+            self.max_drawdown, (self.wealth - self.peak) / self.peak
+        )
+        return self.max_drawdown
+
+    def to_dict(self):
+        return {
+            "wealth": self.wealth,
+            "peak": self.peak,
+            "max_drawdown": self.max_drawdown,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        dd = cls()
+        dd.wealth = state["wealth"]
+        dd.peak = state["peak"]
+        dd.max_drawdown = state["max_drawdown"]
+        return dd
+
+
+class StreamingRatios:
+    """Running Sharpe / Sortino / max drawdown, matching ratios(returns)."""
+
+    def __init__(self, risk_free_rate=0.2):
+        self.risk_free_rate = risk_free_rate
+        self.returns = _Moments()
+        self.downside = _Moments()  # negative returns only
+        self.drawdown = StreamingDrawdown()
+
+    def update(self, r):
+        if math.isnan(r):
+            return self.value  # ratios() drops NaNs too
+        self.returns.update(r)
+        if r < 0:
+            self.downside.update(r)
+        self.drawdown.update(r)
+        return self.value
+
+    def _annualised(self, std):
+        excess = self.returns.mean - self.risk_free_rate / 252
+        # numpy semantics for a zero std (inf / nan) rather than raising
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return float(np.float64(excess) / std * math.sqrt(252))
+
+    @property
+    def sharpe(self):
+        return self._annualised(self.returns.std)
+
+    @property
+    def sortino(self):
+        return self._annualised(self.downside.std)
+
+    @property
+    def max_drawdown(self):
+        return self.drawdown.max_drawdown
+
+    @property
+    def value(self):
+        return self.sharpe, self.sortino, self.max_drawdown
+
+    def to_dict(self):
+        return {
+            "risk_free_rate": self.risk_free_rate,
+            "returns": self.returns.to_dict(),
+            "downside": self.downside.to_dict(),
+            "drawdown": self.drawdown.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        ratios = cls(state["risk_free_rate"])
+        ratios.returns = _Moments(**state["returns"])
+        ratios.downside = _Moments(**state["downside"])
+        ratios.drawdown = StreamingDrawdown.from_dict(state["drawdown"])
+        return ratios
+
+
+class LiveMetrics:
+    """Feeds closing prices to SMA/EMA and their simple returns to the ratios."""
+
+    def __init__(self, window=20, risk_free_rate=0.2):
+        self.sma = StreamingSMA(window)
+        self.ema = StreamingEMA(window)
+        self.ratios = StreamingRatios(risk_free_rate)
+        self.last_price = math.nan
+
+    def update(self, price):
+        if math.isnan(price):
+            return self.snapshot()
+        if not math.isnan(self.last_price):
+            self.ratios.update(price / self.last_price - 1)
+        self.last_price = price
+        self.sma.update(price)
+        self.ema.update(price)
+        return self.snapshot()
+
+    def snapshot(self):
+        sharpe, sortino, max_drawdown = self.ratios.value
+        return {
+            "price": self.last_price,
+            "sma": self.sma.value,
+            "ema": self.ema.value,
+            "sharpe": sharpe,
+            "sortino": sortino,
+            "max_drawdown": max_drawdown,
+        }
+
+    def to_dict(self):
+        return {
+            "sma": self.sma.to_dict(),
+            "ema": self.ema.to_dict(),
+            "ratios": self.ratios.to_dict(),
+            "last_price": self.last_price,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        live = cls()
+        live.sma = StreamingSMA.from_dict(state["sma"])
+        live.ema = StreamingEMA.from_dict(state["ema"])
+        live.ratios = StreamingRatios.from_dict(state["ratios"])
+        live.last_price = state["last_price"]
+        return live
+
+    def save(self, path):
+        # NaN is written as JSON NaN, which json.load reads back
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def main():
+    import pandas as pd
+
+    import financial_time_series as fts
+
+    rng = np.random.default_rng(0)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, 500)))
+
+    live = LiveMetrics(window=20)
+    for price in prices[:250]:
+        live.update(price)
+    # checkpoint and restore mid-stream
+    live = LiveMetrics.from_dict(json.loads(json.dumps(live.to_dict())))
+    for price in prices[250:]:
+        snapshot = live.update(price)
+
+    data = pd.DataFrame({"Close": prices, "Adj Close": prices})
+    sma, ema = fts.moving_avgs(data)
+    sharpe, sortino, max_dd = fts.ratios(fts.daily_returns(data)["simple_return"])
+    print("          live        batch")
+    print(f"SMA     {snapshot['sma']:.6f}  {sma.iloc[-1]:.6f}")
+    print(f"EMA     {snapshot['ema']:.6f}  {ema.iloc[-1]:.6f}")
+    print(f"Sharpe  {snapshot['sharpe']:.6f}  {sharpe:.6f}")
+    print(f"Sortino {snapshot['sortino']:.6f}  {sortino:.6f}")
+    print(f"MDD     {snapshot['max_drawdown']:.6f}  {max_dd:.6f}")
+
+    # a series that opens with losses, so the peak must start at 1 + r_1
+    returns = np.concatenate([[-0.1, -0.05, 0.05], rng.normal(0.0, 0.02, 250)])
+    ratios = StreamingRatios()
+    for r in returns:
+        ratios.update(r)
+    batch = fts.ratios(pd.Series(returns))
+    print("\nopening losses, live vs batch:")
+    for name, live_value, batch_value in zip(
+        ("Sharpe", "Sortino", "MDD"), ratios.value, batch
+    ):
+        print(f"{name:<7} {live_value:.6f}  {batch_value:.6f}")
+        assert math.isclose(live_value, batch_value, rel_tol=1e-9, abs_tol=1e-12)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,61 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 
-def monte_carlo_pi(sample_sizes):
-    convergence_array_pi = []
-    errors = []
-
-    for n in sample_sizes:
-        samples = np.random.uniform(low=0, high=1, size=(n, 2))
-        pi = 4 * np.mean(samples[:, 0] ** 2 + samples[:, 1] ** 2 <= 1)
-        convergence_array_pi.append(pi)
-        errors.append(np.abs(pi - np.pi))
-
+def streaming_convergence(draw, checkpoints, chunk_size=1_000_000, rng=None):
+    # Running mean and standard error of draw(rng, n) samples, recorded at each
+    # (sorted) checkpoint. The checkpoints are nested in one stream, so a whole
+    # convergence curve costs a single run of max(checkpoints) samples, and
+    # only one chunk of samples is ever in memory.
+    rng = np.random.default_rng() if rng is None else rng
+    checkpoints = np.asarray(checkpoints)
+    if np.any(np.diff(checkpoints) < 0):
+        raise ValueError("checkpoints must be sorted")
+
+    estimates, std_errors = [], []
+    count, mean, m2 = 0, 0.0, 0.0
+    for target in checkpoints:
+        while count < target:
+            x = draw(rng, min(chunk_size, target - count))
+            # merge the chunk's moments into the running ones (Chan et al.)
+            n = len(x)
+            chunk_mean = x.mean()
+            delta = chunk_mean - mean
+            total = count + n
+            mean += delta * n / total
+            m2 += ((x - chunk_mean) ** 2).sum() + delta**2 * count * n / total
+            count = total
+        estimates.append(mean)
+        std_errors.append(np.sqrt(m2 / (count - 1) / count) if count > 1 else np.nan)
+    return np.array(estimates), np.array(std_errors)
+
+
+def _pi_draws(rng, n):
+    samples = rng.random((n, 2))
+    return 4.0 * (samples[:, 0] ** 2 + samples[:, 1] ** 2 <= 1)
+
+
+def _x_squared_draws(rng, n):
+    return rng.random(n) ** 2
+
+
+def monte_carlo_pi(sample_sizes, rng=None, return_std_errors=False):
+    # (estimates, errors), plus the standard errors if asked for
+    convergence_array_pi, std_errors = streaming_convergence(
+        _pi_draws, sample_sizes, rng=rng
+    )
+    errors = np.abs(convergence_array_pi - np.pi)
+    if return_std_errors:
+        return convergence_array_pi, errors, std_errors
     return convergence_array_pi, errors
 
 
-def ex2(sample_sizes):
-    convergence_array_ex2 = []
-    errors = []
-
-    for n in sample_sizes:
-        samples = np.random.uniform(low=0, high=1, size=n)
-        convergence_array_ex2.append(np.mean(samples**2))
-        errors.append(np.abs(np.mean(samples**2) - (1 / 3)))
+def ex2(sample_sizes, rng=None, return_std_errors=False):
+    convergence_array_ex2, std_errors = streaming_convergence(
+        _x_squared_draws, sample_sizes, rng=rng
+    )
+    errors = np.abs(convergence_array_ex2 - (1 / 3))
+    if return_std_errors:
+        return convergence_array_ex2, errors, std_errors
     return convergence_array_ex2, errors
 
 
@@ -32,11 +65,21 @@ def cdfx(n):
 
 
 def plot_convergence_and_error(
-    sample_sizes, estimates, errors, true_value, name, ylim=None
+    sample_sizes, estimates, errors, true_value, name, ylim=None, std_errors=None
 ):
+    import matplotlib.pyplot as plt
+
     fig, axes = plt.subplots(1, 2, figsize=(12, 5))
 
     axes[0].plot(sample_sizes, estimates, marker="o", label=f"Estimated {name}")
+    if std_errors is not None:
+        axes[0].fill_between(
+            sample_sizes,
+            estimates - 1.96 * std_errors,
+            estimates + 1.96 * std_errors,
+            alpha=0.2,
+            label="95% CI",
+        )
     axes[0].axhline(y=true_value, color="r", linestyle="--", label=f"True {name}")
     axes[0].set_xscale("log")
     axes[0].set_title(f"{name} Estimation Convergence")
@@ -51,6 +94,8 @@ def plot_convergence_and_error(
     )
     ref = errors[0] * np.sqrt(sample_sizes[0]) / np.sqrt(sample_sizes)
     axes[1].plot(sample_sizes, ref, "--", label="~ 1/√n")
+    if std_errors is not None:
+        axes[1].plot(sample_sizes, std_errors, ":", label="Std Error")
     axes[1].set_xscale("log")
     axes[1].set_yscale("log")
     axes[1].set_title(f"{name} Error Scaling")
@@ -65,17 +110,34 @@ def plot_convergence_and_error(
 
 def main():
     sample_sizes = np.logspace(2, 7, 40, dtype=int)
-    pi_estimate_array, pi_errors = monte_carlo_pi(sample_sizes)
-    print(pi_estimate_array[-1])
-    ex2_estimate_array, ex2_errors = ex2(sample_sizes)
+    # each curve is one nested stream of max(sample_sizes) draws
+    pi_estimate_array, pi_errors, pi_std_errors = monte_carlo_pi(
+        sample_sizes, return_std_errors=True
+    )
+    print(pi_estimate_array[-1], "+/-", pi_std_errors[-1])
+    ex2_estimate_array, ex2_errors, ex2_std_errors = ex2(
+        sample_sizes, return_std_errors=True
+    )
     cdfval = cdfx(n=10000)
     print(cdfval)
 
     plot_convergence_and_error(
-        sample_sizes, pi_estimate_array, pi_errors, np.pi, "Pi", ylim=(3.0, 3.2)
+        sample_sizes,
+        pi_estimate_array,
+        pi_errors,
+        np.pi,
+        "Pi",
+        ylim=(3.0, 3.2),
+        std_errors=pi_std_errors,
     )
     plot_convergence_and_error(
-        sample_sizes, ex2_estimate_array, ex2_errors, 1 / 3, "1/3", ylim=(0.3, 0.4)
+        sample_sizes,
+        ex2_estimate_array,
+        ex2_errors,
+        1 / 3,
+        "1/3",
+        ylim=(0.3, 0.4),
+        std_errors=ex2_std_errors,
     )
 
 
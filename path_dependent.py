@@ -0,0 +1,185 @@
+from typing import NamedTuple
+
+import numpy as np
+
+# Asian / barrier / lookback pricing under GBM without storing the path matrix.
+# Every path is stepped forward once and only per-path running aggregates are
+# kept, so memory is O(n_paths) whatever n_steps is.
+#
+# Monitoring dates are t_i = i * T / n_steps, i = 1..n_steps (the average and
+# the discrete barrier use these). With bridge=True the barrier and the
+# max/min are corrected for what the Brownian bridge does between dates, which
+# gives continuous-monitoring prices without needing tiny steps.
+
+
+class PathAggregates(NamedTuple):
+    S_T: np.ndarray
+    average: np.ndarray  # arithmetic average over the monitoring dates
+    maximum: np.ndarray  # running max (includes s_0)
+    minimum: np.ndarray  # running min (includes s_0)
+    survival: np.ndarray  # prob. the barrier was never hit, 1.0 if no barrier
+    T: float
+    r: float
+
+
+def simulate_path_aggregates(
+    s_0,
+    sigma,
+    r,
+    T,
+    n_steps,
+    n_paths,
+    barrier=None,
+    barrier_type="up",
+    bridge=True,
+    rng=None,
+):
+    rng = np.random.default_rng() if rng is None else rng
+    if barrier_type not in ("up", "down"):
+        raise ValueError("barrier_type must be 'up' or 'down'")
+
+    dt = T / n_steps
+    drift = (r - 0.5 * sigma**2) * dt
+    vol = sigma * np.sqrt(dt)
+    var = sigma**2 * dt
+
+    log_s = np.full(n_paths, np.log(s_0))
+    running_sum = np.zeros(n_paths)
+    log_max = log_s.copy()
+    log_min = log_s.copy()
+    survival = np.ones(n_paths)
+    log_h = np.log(barrier) if barrier is not None else None
+    if barrier is not None:
+        # already through the barrier at t=0
+        if (barrier_type == "up" and s_0 >= barrier) or (
+            barrier_type == "down" and s_0 <= barrier
+        ):
+            survival[:] = 0.0
+
+    for _ in range(n_steps):
+        prev = log_s
+        log_s = prev + drift + vol * rng.standard_normal(n_paths)
+        running_sum += np.exp(log_s)
+
+        if bridge:
+            # sample the max/min of the bridge between the two dates exactly:
+            # M = (a + b + sqrt((b - a)^2 - 2 var log U)) / 2
+            mid = 0.5 * (prev + log_s)
+            spread = (log_s - prev) ** 2
+            up = 0.5 * np.sqrt(spread - 2 * var * np.log(rng.random(n_paths)))
+            down = 0.5 * np.sqrt(spread - 2 * var * np.log(rng.random(n_paths)))
+            np.maximum(log_max, mid + up, out=log_max)
+            np.minimum(log_min, mid - down, out=log_min)
+        else:
+            np.maximum(log_max, log_s, out=log_max)
+            np.minimum(log_min, log_s, out=log_min)
+
+        if barrier is not None:
+            if barrier_type == "up":
+                a, b = log_h - prev, log_h - log_s
+            else:
+                a, b = prev - log_h, log_s - log_h
+            # knocked out at the monitoring date
+            survival[b <= 0] = 0.0
+            if bridge:
+                # and the chance the bridge crossed in between, given both
+                # ends are on the safe side (standard Brownian-bridge result);
+                # weighting by it rather than sampling keeps the variance down
+                alive = survival > 0
+                p_cross = np.exp(-2 * a[alive] * b[alive] / var)
+                survival[alive] *= 1 - p_cross
+
+    return PathAggregates(
+        S_T=np.exp(log_s),
+        average=running_sum / n_steps,
+        maximum=np.exp(log_max),
+        minimum=np.exp(log_min),
+        survival=survival,
+        T=T,
+        r=r,
+    )
+
+
+def _discounted_estimate(payoffs, r, T):
+    # price and standard error of the mean
+    disc = np.exp(-r * T) * payoffs
+    return disc.mean(), disc.std(ddof=1) / np.sqrt(len(disc))
+
+
+def _vanilla_payoff(S, K, option_type):
+    if option_type == "call":
+        return np.maximum(S - K, 0.0)
+    if option_type == "put":
+        return np.maximum(K - S, 0.0)
+    raise ValueError("option_type must be 'call' or 'put'")
+
+
+def asian_option_price(agg, K, option_type="call"):
+    # fixed strike, arithmetic average
+    return _discounted_estimate(
+        _vanilla_payoff(agg.average, K, option_type), agg.r, agg.T
+    )
+
+
+def barrier_option_price(agg, K, option_type="call", knock="out"):
+    payoff = _vanilla_payoff(agg.S_T, K, option_type)
+    if knock == "out":
+        payoff = payoff * agg.survival
+    elif knock == "in":
+        payoff = payoff * (1 - agg.survival)  # in + out = vanilla
+    else:
+        raise ValueError("knock must be 'in' or 'out'")
+    return _discounted_estimate(payoff, agg.r, agg.T)
+
+
+def lookback_option_price(agg, option_type="call", K=None):
+    # floating strike if K is None, otherwise fixed strike on the max/min
+    if K is None:
+        if option_type == "call":
+            payoff = agg.S_T - agg.minimum
+        elif option_type == "put":
+            payoff = agg.maximum - agg.S_T
+        else:
+            raise ValueError("option_type must be 'call' or 'put'")
+    elif option_type == "call":
+        payoff = np.maximum(agg.maximum - K, 0.0)
+    elif option_type == "put":
+        payoff = np.maximum(K - agg.minimum, 0.0)
+    else:
+        raise ValueError("option_type must be 'call' or 'put'")
+    return _discounted_estimate(payoff, agg.r, agg.T)
+
+
+def main():
+    r, T, s0, sigma, K = 0.05, 1, 100, 0.2, 100
+    n_steps, n_paths = 252, 200_000
+    H = 120
+
+    agg = simulate_path_aggregates(
+        s0, sigma, r, T, n_steps, n_paths, barrier=H, barrier_type="up", bridge=True
+    )
+    print("Asian call          = %.4f (se %.4f)" % asian_option_price(agg, K))
+    print(
+        "Up-and-out call     = %.4f (se %.4f)"
+        % barrier_option_price(agg, K, knock="out")
+    )
+    print(
+        "Up-and-in call      = %.4f (se %.4f)"
+        % barrier_option_price(agg, K, knock="in")
+    )
+    print("Floating lookback c = %.4f (se %.4f)" % lookback_option_price(agg, "call"))
+    print("Floating lookback p = %.4f (se %.4f)" % lookback_option_price(agg, "put"))
+
+    # without the bridge correction the discrete barrier misses crossings
+    # between dates, so the knock-out price comes out too high
+    discrete = simulate_path_aggregates(
+        s0, sigma, r, T, n_steps, n_paths, barrier=H, barrier_type="up", bridge=False
+    )
+    print(
+        "Up-and-out call (discrete monitoring) = %.4f (se %.4f)"
+        % barrier_option_price(discrete, K, knock="out")
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+"""Shared on-disk cache of daily OHLCV prices.
+
+Every ticker gets a folder of memory-mappable NumPy columns::
+
+    <cache_dir>/<TICKER>/meta.json         fields, date ranges covered, version
+    <cache_dir>/<TICKER>/<version>/dates.npy   datetime64[D], sorted
+    <cache_dir>/<TICKER>/<version>/Close.npy   float64, one file per field
+
+Requests only go to the backend for the parts of [start, end) that no earlier
+request covered, so re-running research code over the same history costs no
+downloads. A range only counts as covered once its fetch returned rows (a
+failed yfinance download is an empty frame), so it is retried next time.
+
+The cache can be shared between processes: updates of a ticker hold a file
+lock, every update writes a new version folder and then swaps meta.json over
+to it in one rename, so readers see either the old columns or the new ones,
+never a mix. ``PriceCache.read`` returns read-only memmap slices (no copy);
+``download`` mirrors ``yf.download(tickers, start, end)`` for existing
+callers. Backends are plain objects with ``fetch(ticker, start, end)``, so the
+cache can be run offline against ``FrameBackend`` / ``CSVBackend``.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get("PRICE_CACHE_DIR", Path.home() / ".cache" / "quant_portfolio")
+)
+
+
+class YFinanceBackend:
+    """Downloads one ticker at a time with yfinance (its default adjustment)."""
+
+    name = "yfinance"
+
+    def __init__(self, **download_kwargs):
+        self.download_kwargs = download_kwargs
+
+    def fetch(self, ticker, start, end):
+        import yfinance as yf
+
+        data = yf.download(
+            ticker, start=start, end=end, progress=False, **self.download_kwargs
+        )
+        if isinstance(data.columns, pd.MultiIndex):
+            data = data.xs(ticker, axis=1, level=-1)
+        return data
+
+
+class FrameBackend:
+    """Serves prices from in-memory DataFrames, e.g. a fake source in tests.
+
+    ``calls`` records every (ticker, start, end) fetched, so delta fetching
+    can be checked.
+    """
+
+    name = "frames"
+
+    def __init__(self, frames):
+        self.frames = frames  # ticker -> DataFrame of fields indexed by date
+        self.calls = []
+
+    @classmethod
+    def from_wide(cls, prices, field="Close"):
+        # one field for many tickers, like tech_prices.csv
+        return cls(
+            {ticker: prices[[ticker]].set_axis([field], axis=1) for ticker in prices}
+        )
+
+    def fetch(self, ticker, start, end):
+        self.calls.append((ticker, start, end))
+        frame = self.frames[ticker]
+        return frame[(frame.index >= start) & (frame.index < end)]
+
+
+class CSVBackend:
+    """Reads <directory>/<TICKER>.csv files (date index, one column per field)."""
+
+    name = "csv"
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.calls = []
+
+    def fetch(self, ticker, start, end):
+        self.calls.append((ticker, start, end))
+        frame = pd.read_csv(
+            self.directory / f"{ticker}.csv", index_col=0, parse_dates=True
+        )
+        return frame[(frame.index >= start) & (frame.index < end)]
+
+
+@contextmanager
+def _locked(path):
+    # exclusive lock between processes, held for a whole update
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _day(value):
+    return np.datetime64(pd.Timestamp(value).date(), "D")
+
+
+def _merge_intervals(intervals):
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def _missing_intervals(covered, start, end):
+    # parts of [start, end) not inside any covered [a, b)
+    missing = []
+    cursor = start
+    for a, b in covered:
+        if b <= cursor or a >= end:
+            continue
+        if a > cursor:
+            missing.append((cursor, a))
+        cursor = max(cursor, b)
+    if cursor < end:
+        missing.append((cursor, end))
+    return missing
+
+
+class PriceCache:
+    def __init__(self, cache_dir=None, backend=None):
+        self.backend = backend or YFinanceBackend()
+        # keep different sources apart, their adjustments need not agree
+        self.root = Path(cache_dir or DEFAULT_CACHE_DIR) / self.backend.name
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _folder(self, ticker):
+        return self.root / ticker.replace("/", "_")
+
+    def _meta(self, ticker):
+        meta_file = self._folder(ticker) / "meta.json"
+        if not meta_file.exists():
+            return {"fields": [], "covered": [], "version": None}
+        with open(meta_file) as f:
+            meta = json.load(f)
+        if "version" not in meta:
+            # written by the earlier single-folder layout, start afresh
+            return {"fields": [], "covered": [], "version": None}
+        meta["covered"] = [[_day(a), _day(b)] for a, b in meta["covered"]]
+        return meta
+
+    def _columns(self, ticker, meta, fields):
+        if meta["version"] is None:
+            empty = np.array([], dtype=float)
+            return np.array([], dtype="datetime64[D]"), {f: empty for f in fields}
+        unknown = [field for field in fields if field not in meta["fields"]]
+        if unknown:
+            raise KeyError(
+                f"{ticker} has no {unknown} in the cache, stored fields are "
+                f"{meta['fields']}"
+            )
+        folder = self._folder(ticker) / meta["version"]
+        dates = np.load(folder / "dates.npy", mmap_mode="r")
+        return dates, {
+            field: np.load(folder / f"{field}.npy", mmap_mode="r") for field in fields
+        }
+
+    def _store(self, ticker, meta, new, covered):
+        # merge the fetched rows into a new version folder, then point
+        # meta.json at it with one atomic rename; callers hold the lock
+        folder = self._folder(ticker)
+        old_dates, old_columns = self._columns(ticker, meta, meta["fields"])
+        old = pd.DataFrame(
+            {field: np.array(col) for field, col in old_columns.items()},
+            index=pd.DatetimeIndex(np.array(old_dates)),
+        )
+        new = new.copy()
+        new.index = pd.DatetimeIndex(new.index).tz_localize(None).normalize()
+        merged = pd.concat([old, new])
+        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+
+        fields = list(merged.columns)
+        version = Path(tempfile.mkdtemp(prefix="v", dir=folder))
+        np.save(version / "dates.npy", merged.index.values.astype("datetime64[D]"))
+        for field in fields:
+            np.save(version / f"{field}.npy", merged[field].to_numpy(dtype=float))
+
+        new_meta = {
+            "fields": fields,
+            "covered": [[str(a), str(b)] for a, b in _merge_intervals(covered)],
+            "version": version.name,
+        }
+        with tempfile.NamedTemporaryFile(
+            "w", dir=folder, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(new_meta, f, indent=2)
+        os.replace(f.name, folder / "meta.json")
+
+        # readers may still be on the previous version; older ones (and any
+        # left by an interrupted update) go
+        keep = {version.name, meta["version"]}
+        for path in folder.glob("v*"):
+            if path.is_dir() and path.name not in keep:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def update(self, ticker, start, end):
+        """Fetches whatever part of [start, end) is not cached yet."""
+        start, end = _day(start), _day(end)
+        if not _missing_intervals(self._meta(ticker)["covered"], start, end):
+            return
+        # today's bar is still moving, so never mark it (or later) as covered
+        end_complete = min(end, np.datetime64("today", "D"))
+        folder = self._folder(ticker)
+        folder.mkdir(exist_ok=True)
+        with _locked(folder / ".lock"):
+            # another process may have fetched it while we waited
+            meta = self._meta(ticker)
+            covered = list(meta["covered"])
+            frames = []
+            for a, b in _missing_intervals(covered, start, end):
+                frame = self.backend.fetch(ticker, str(a), str(b))
+                if frame is None or not len(frame):
+                    continue  # failed (or genuinely empty): try again next time
+                frames.append(frame)
+                if a < end_complete:
+                    covered.append([a, min(b, end_complete)])
+            if frames:
+                self._store(ticker, meta, pd.concat(frames), covered)
+
+    def read(self, ticker, start, end, fields=None):
+        """Dates and {field: array} for [start, end) as read-only memmap views.
+
+        Raises KeyError for a field the cache does not hold.
+        """
+        self.update(ticker, start, end)
+        for attempt in range(3):
+            meta = self._meta(ticker)
+            try:
+                dates, columns = self._columns(ticker, meta, fields or meta["fields"])
+                break
+            except FileNotFoundError:
+                # that version was retired between reading meta.json and the
+                # columns (two updates went by), read meta.json again
+                if attempt == 2:
+                    raise
+        lo, hi = np.searchsorted(dates, [_day(start), _day(end)])
+        return dates[lo:hi], {field: col[lo:hi] for field, col in columns.items()}
+
+    def frame(self, ticker, start, end, fields=None):
+        dates, columns = self.read(ticker, start, end, fields)
+        return pd.DataFrame(
+            columns, index=pd.DatetimeIndex(np.asarray(dates), name="Date")
+        )
+
+
+_default_caches = {}
+
+
+def download(tickers, start=None, end=None, cache=None, **kwargs):
+    """Cached stand-in for yf.download(tickers, start=..., end=...).
+
+    Returns the same (field, ticker) column MultiIndex. Extra keyword
+    arguments are handed to yf.download when no cache is given.
+    """
+    if cache is None:
+        key = tuple(sorted(kwargs.items()))
+        if key not in _default_caches:
+            _default_caches[key] = PriceCache(backend=YFinanceBackend(**kwargs))
+        cache = _default_caches[key]
+    if isinstance(tickers, str):
+        tickers = tickers.replace(",", " ").split()
+    start = start or "1970-01-01"
+    end = end or str(np.datetime64("today", "D") + 1)
+    frames = {ticker: cache.frame(ticker, start, end) for ticker in tickers}
+    data = pd.concat(frames, axis=1, names=["Ticker", "Price"])
+    return data.swaplevel(axis=1).sort_index(axis=1, level=0, sort_remaining=False)
+
+
+def main():
+    # offline demo: serve tech_prices.csv through the cache
+    prices = pd.read_csv(
+        Path(__file__).parent / "CovarianceMatrixExplorer" / "data" / "tech_prices.csv",
+        index_col=0,
+        parse_dates=True,
+    )
+    backend = FrameBackend.from_wide(prices)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PriceCache(tmp, backend)
+        download(["AAPL", "MSFT"], "2021-01-01", "2022-01-01", cache=cache)
+        download(["AAPL", "MSFT"], "2020-06-01", "2022-06-01", cache=cache)
+        data = download(["AAPL", "MSFT"], "2020-06-01", "2022-06-01", cache=cache)
+        print(data["Close"].tail())
+        print("backend fetches:")
+        for call in backend.calls:
+            print(" ", call)
+
+
+if __name__ == "__main__":
+    main()
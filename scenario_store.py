@@ -0,0 +1,175 @@
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from brownian_motion import (
+    euro_call_price,
+    gbm_path_blocks,
+    plot_mean_vs_analytical,
+    running_path_statistics,
+)
+
+# A scenario set is two files side by side:
+#   <name>.npy   the (n_paths, n_steps) price matrix, memory-mapped
+#   <name>.json  the seed and GBM parameters that produced it
+# so the same paths can be reused across runs (and regenerated if deleted).
+
+
+def _store_paths(path):
+    path = Path(path)
+    if path.suffix == ".npy":
+        path = path.with_suffix("")
+    return path.with_suffix(".npy"), path.with_suffix(".json")
+
+
+class ScenarioSet:
+    """Read-only view of a stored scenario set; nothing is loaded until sliced."""
+
+    def __init__(self, path):
+        data_file, meta_file = _store_paths(path)
+        with open(meta_file) as f:
+            self.params = json.load(f)
+        self.paths = np.load(data_file, mmap_mode="r")  # zero-copy memmap
+        self.n_paths, self.n_steps = self.paths.shape
+        self.T = self.params["T"]
+        self.t = np.linspace(0, self.T, self.n_steps)  # same grid as gbm_paths
+
+    def __repr__(self):
+        return (
+            f"ScenarioSet({self.n_paths} paths x {self.n_steps} steps, {self.params})"
+        )
+
+    def path_slice(self, start=0, stop=None):
+        # rows are contiguous on disk so this only pages in the rows asked for
+        return self.paths[start:stop]
+
+    def time_slice(self, start=0, stop=None):
+        # columns are strided, so for big sets prefer iterating path_blocks
+        return self.paths[:, start:stop]
+
+    def terminal(self, block_paths=10_000):
+        return np.concatenate(
+            [np.array(S[:, -1]) for S in self.path_blocks(block_paths)]
+        )
+
+    def path_blocks(self, block_paths=1000):
+        for start in range(0, self.n_paths, block_paths):
+            yield self.paths[start : start + block_paths]
+
+    def statistics(self, block_paths=1000, n_keep=20):
+        # same PathStatistics as brownian_motion.gbm_statistics, but from disk
+        return running_path_statistics(
+            self.path_blocks(block_paths), self.T, n_keep=n_keep
+        )
+
+
+def write_scenarios(
+    path,
+    s_0,
+    sigma,
+    r,
+    T,
+    n_steps,
+    n_paths,
+    seed,
+    block_paths=1000,
+    dtype=np.float64,
+):
+    # Simulate straight into the memmap block by block, so writing a set that
+    # doesn't fit in RAM is fine.
+    if seed is None:
+        raise ValueError("a stored scenario set needs a seed to be reproducible")
+    data_file, meta_file = _store_paths(path)
+    data_file.parent.mkdir(parents=True, exist_ok=True)
+    # drop any old metadata first, so until the new set is complete there is
+    # no metadata claiming the file is valid
+    meta_file.unlink(missing_ok=True)
+    tmp_file = data_file.with_suffix(".tmp.npy")
+    params = {
+        "s_0": s_0,
+        "sigma": sigma,
+        "r": r,
+        "T": T,
+        "n_steps": n_steps,
+        "n_paths": n_paths,
+        "seed": seed,
+        "dtype": np.dtype(dtype).name,
+    }
+
+    out = open_memmap(tmp_file, mode="w+", dtype=dtype, shape=(n_paths, n_steps))
+    blocks = gbm_path_blocks(
+        s_0,
+        sigma,
+        r,
+        T,
+        n_steps,
+        n_paths,
+        block_paths,
+        dtype=dtype,
+        rng=np.random.default_rng(seed),
+    )
+    row = 0
+    for S in blocks:
+        out[row : row + len(S)] = S
+        row += len(S)
+    out.flush()
+    del out
+    # replaced rather than overwritten in place, so memmaps of an old set
+    # that are still open keep their data
+    tmp_file.replace(data_file)
+
+    # metadata last, so a crash mid-write leaves no valid-looking set behind
+    with open(meta_file, "w") as f:
+        json.dump(params, f, indent=2)
+    return ScenarioSet(path)
+
+
+def open_scenarios(path):
+    return ScenarioSet(path)
+
+
+def load_or_create(path, s_0, sigma, r, T, n_steps, n_paths, seed, **kwargs):
+    # reuse the stored set if it was made with exactly these parameters
+    if seed is None:
+        raise ValueError("a stored scenario set needs a seed to be reproducible")
+    data_file, meta_file = _store_paths(path)
+    if data_file.exists() and meta_file.exists():
+        scenarios = ScenarioSet(path)
+        wanted = {
+            "s_0": s_0,
+            "sigma": sigma,
+            "r": r,
+            "T": T,
+            "n_steps": n_steps,
+            "n_paths": n_paths,
+            "seed": seed,
+            "dtype": np.dtype(kwargs.get("dtype", np.float64)).name,
+        }
+        if all(scenarios.params.get(k) == v for k, v in wanted.items()):
+            return scenarios
+    return write_scenarios(path, s_0, sigma, r, T, n_steps, n_paths, seed, **kwargs)
+
+
+def main():
+    # the demo set is ~160 MB, so keep it out of the working tree by default
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+    else:
+        path = Path(tempfile.gettempdir()) / "quant_portfolio" / "gbm_base"
+    n_steps, n_paths = 1000, 20000
+    r, T, s0, sigma, K = 0.05, 1, 105, 0.2, 100
+    scenarios = load_or_create(path, s0, sigma, r, T, n_steps, n_paths, seed=42)
+    print(scenarios)
+
+    # consumers read slices / blocks off the memmap instead of the full matrix
+    print("Monte Carlo Call Price =", euro_call_price(scenarios.terminal(), K, r, T))
+    print("First path, last 3 steps:", scenarios.path_slice(0, 1)[0, -3:])
+    plot_mean_vs_analytical(T, scenarios.statistics(), s0, r)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar,
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMartinLutherKingJr,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday,
+)
+
+# Exchange trading calendars, so gap filling only fills real sessions instead
+# of every business day (which invents prices on exchange holidays).
+
+
+class NYSEHolidayCalendar(AbstractHolidayCalendar):
+    rules = [
+        # a Saturday New Year's Day is not made up on the Friday before
+        Holiday("New Year's Day", month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday(
+            "Juneteenth",
+            month=6,
+            day=19,
+            start_date="2022-01-01",
+            observance=nearest_workday,
+        ),
+        Holiday("Independence Day", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas", month=12, day=25, observance=nearest_workday),
+    ]
+
+
+# one-off closures (weather, national days of mourning, 9/11)
+NYSE_SPECIAL_CLOSURES = pd.to_datetime(
+    [
+        "2001-09-11",
+        "2001-09-12",
+        "2001-09-13",
+        "2001-09-14",
+        "2004-06-11",
+        "2007-01-02",
+        "2012-10-29",
+        "2012-10-30",
+        "2018-12-05",
+        "2025-01-09",
+    ]
+)
+
+EXCHANGES = {
+    # name: (holiday calendar, special closures, session open, session close,
+    # timezone of the open/close times)
+    "XNYS": (
+        NYSEHolidayCalendar,
+        NYSE_SPECIAL_CLOSURES,
+        "09:30",
+        "16:00",
+        "America/New_York",
+    ),
+    "XNAS": (
+        NYSEHolidayCalendar,
+        NYSE_SPECIAL_CLOSURES,
+        "09:30",
+        "16:00",
+        "America/New_York",
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def trading_sessions(exchange="XNYS", start="1990-01-01", end="2040-12-31"):
+    """Trading days of an exchange, computed once per (exchange, range)."""
+    if exchange not in EXCHANGES:
+        raise ValueError(f"unknown exchange {exchange!r}, one of {list(EXCHANGES)}")
+    calendar, closures, _, _, _ = EXCHANGES[exchange]
+    weekdays = pd.bdate_range(start, end)
+    holidays = calendar().holidays(start, end)
+    return weekdays.difference(holidays).difference(closures)
+
+
+def trading_index(start, end, exchange="XNYS", freq=None):
+    """Sessions in [start, end], or intraday bar timestamps when freq is set.
+
+    Sessions are naive dates. With e.g. freq="1min" the bars are labelled by
+    their start time, localised to the exchange's timezone (as intraday bars
+    from yfinance are), and run from the open to one bar before the close of
+    every session (early closes are not modelled). start/end may be dates or
+    timestamps, tz-aware or exchange-local; every session they touch is kept.
+    """
+    sessions = trading_sessions(exchange)
+    _, _, open_time, close_time, tz = EXCHANGES[exchange]
+
+    def session_day(value):
+        value = pd.Timestamp(value)
+        if value.tz is not None:
+            value = value.tz_convert(tz).tz_localize(None)
+        return value.normalize()
+
+    sessions = sessions[
+        (sessions >= session_day(start)) & (sessions <= session_day(end))
+    ]
+    if freq is None:
+        return sessions
+    close = pd.Timedelta(f"{close_time}:00")
+    offsets = pd.timedelta_range(pd.Timedelta(f"{open_time}:00"), close, freq=freq)
+    offsets = offsets[offsets < close]
+    stamps = sessions.values[:, None] + offsets.values[None, :]
+    return pd.DatetimeIndex(stamps.ravel()).tz_localize(tz)